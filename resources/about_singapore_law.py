@@ -8,23 +8,156 @@ Tables created:
 - about_singapore_law_fragments: Content chunks from each chapter
 """
 
+import asyncio
 import hashlib
+import logging
 import os
+import re
+import site
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
 
+import hishel
 import httpx
-from bs4 import BeautifulSoup
+from hishel.httpx import AsyncCacheClient
+from lxml import etree
 from sqlite_utils.db import Table
 
+from chapter_parser import ContentPart, get_text, parse_chapter_content
+from http_helpers import new_client, retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
 # Zeeker calls fetch_data twice for fragment resources (second call builds main_data_context
 # for fetch_fragments_data). The second call passes existing_table=None, so the dedup check
 # sees an empty set and returns all chapters again, causing duplicate rows. This sentinel
 # detects the second call and short-circuits it. Same pattern as zeeker-judgements.
 _RAN_PID_KEY = "_ABOUT_SG_LAW_MAIN_RAN_PID"
 
+# Cap on chapter pages fetched at once
+SCRAPE_CONCURRENCY = int(os.environ.get("ABOUT_SG_LAW_CONCURRENCY", "8"))
+# Requests started per second across a run, to stay polite to the site
+REQUESTS_PER_SECOND = float(os.environ.get("ABOUT_SG_LAW_RATE", "5"))
+# Attempts per page when the site answers 429 Too Many Requests
+MAX_ATTEMPTS = 3
+# Bytes read from the network per parser feed when streaming a page
+STREAM_CHUNK_SIZE = 64 * 1024
+# On-disk HTTP cache, so re-runs revalidate pages (ETag/Last-Modified) and get a 304 for
+# unchanged chapters instead of downloading them again. Set to an empty string to disable.
+# The build workflow carries .http_cache/ between CI runs with actions/cache.
+HTTP_CACHE_PATH = os.environ.get("ABOUT_SG_LAW_HTTP_CACHE", ".http_cache/about_singapore_law.db")
+
+
+def _new_client() -> httpx.AsyncClient:
+    """Build the client shared by every request in one fetch run.
+
+    Responses go through the HTTP cache unless it is disabled.
+    """
+    limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    if not HTTP_CACHE_PATH:
+        return new_client(timeout=30.0, limits=limits)
+
+    os.makedirs(os.path.dirname(HTTP_CACHE_PATH) or ".", exist_ok=True)
+    return new_client(
+        timeout=30.0,
+        client_class=AsyncCacheClient,
+        limits=limits,
+        storage=hishel.AsyncSqliteStorage(database_path=HTTP_CACHE_PATH),
+        # A private cache: the default shared one refuses Cache-Control: private responses
+        policy=hishel.SpecificationPolicy(cache_options=hishel.CacheOptions(shared=False)),
+    )
+
+
+class _RateLimiter:
+    """Space request starts evenly across a run, pausing everyone when the site asks us to.
+
+    Created per run, like the client (see http_helpers).
+    """
+
+    def __init__(self, rate: float = REQUESTS_PER_SECOND):
+        self._interval = 1.0 / rate
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        """Wait for this request's slot."""
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start)
+        self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every later request for ``seconds``."""
+        resume = asyncio.get_running_loop().time() + seconds
+        self._next_start = max(self._next_start, resume)
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """Seconds to back off for a 429 response, from its Retry-After header if present."""
+    return retry_after_seconds(response, default=1.0)
+
+
+async def _get(
+    client: httpx.AsyncClient,
+    url: str,
+    limiter: Optional[_RateLimiter] = None,
+    stream: bool = False,
+) -> httpx.Response:
+    """GET a page within the rate limit, retrying after the delay a 429 asks for.
+
+    With ``stream``, the body is left unread for the caller to stream, and the caller must
+    close the response. The last response is returned even if it is still a 429.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        if limiter:
+            await limiter.wait()
+        response = await client.send(client.build_request("GET", url), stream=stream)
+        if response.status_code != 429 or attempt == MAX_ATTEMPTS - 1:
+            return response
+        await response.aclose()
+        if limiter:
+            limiter.pause(_retry_after(response))
+        else:
+            await asyncio.sleep(_retry_after(response))
+
+
+def _new_parse_pool() -> ProcessPoolExecutor:
+    """Build the process pool that parses chapter pages in parallel across cores.
 
-def fetch_data(existing_table: Optional[Table]) -> List[Dict[str, Any]]:
+    Workers import parse_chapter_content from the chapter_parser sibling module. Zeeker only
+    puts the resources directory on sys.path while loading resources, so it is added to the
+    workers' path here.
+    """
+    return ProcessPoolExecutor(
+        initializer=site.addsitedir, initargs=(os.path.dirname(os.path.abspath(__file__)),)
+    )
+
+
+# Smallest page parse_chapter_content accepts, used to check the workers can run it
+_PROBE_PAGE = b'<div class="edn_article"><p>Probe</p></div>'
+
+
+async def _start_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """Start the parse pool, checking that its workers can run parse_chapter_content.
+
+    Returns None, so pages are parsed in this process instead, if the pool can't be
+    started or its workers can't import the parser (e.g. under an unexpected loader).
+    """
+    pool = None
+    try:
+        pool = _new_parse_pool()
+        await asyncio.wrap_future(pool.submit(parse_chapter_content, _PROBE_PAGE))
+    except Exception as e:
+        logger.warning("Parse workers unavailable, parsing chapter pages in-process: %s", e)
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        return None
+    return pool
+
+
+async def fetch_data(existing_table: Optional[Table]) -> List[Dict[str, Any]]:
     """Discover all legal chapters from multiple Singapore Law Watch sections."""
 
     current_pid = str(os.getpid())
@@ -32,34 +165,33 @@ def fetch_data(existing_table: Optional[Table]) -> List[Dict[str, Any]]:
         return []
     os.environ[_RAN_PID_KEY] = current_pid
 
-    existing_urls = set()
-    if existing_table:
-        existing_urls = {row["item_url"] for row in existing_table.rows}
-
-    all_items = []
-
-    # Process each home page
-    for home_url, home_name in get_home_page_urls():
-        try:
-            # Each "home page" is actually a section with direct chapter links
-            chapter_links = discover_chapter_links(home_url, home_name)
-
-            # Filter out existing chapters
-            new_chapters = [
-                chapter for chapter in chapter_links if chapter["item_url"] not in existing_urls
+    seen_urls = _existing_values(existing_table, "item_url")
+    # One timestamp for the whole run, shared by every section
+    scraped_at = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    # Each "home page" is actually a section with direct chapter links
+    limiter = _RateLimiter()
+    async with _new_client() as client:
+        sections = await asyncio.gather(
+            *[
+                discover_chapter_links(client, home_url, home_name, scraped_at, limiter)
+                for home_url, home_name in get_home_page_urls()
             ]
+        )
 
-            all_items.extend(new_chapters)
-
-            time.sleep(1)  # Be respectful
-
-        except Exception:
-            continue
+    # Sections cross-link chapters, so skip URLs already stored or already found in an
+    # earlier section. The first section to list a chapter keeps it.
+    all_items = []
+    for chapter_links in sections:
+        for chapter in chapter_links:
+            if chapter["item_url"] not in seen_urls:
+                seen_urls.add(chapter["item_url"])
+                all_items.append(chapter)
 
     return all_items
 
 
-def fetch_fragments_data(
+async def fetch_fragments_data(
     existing_fragments_table: Optional[Table],
     main_data_context: Optional[List[Dict[str, Any]]] = None,
 ) -> List[Dict[str, Any]]:
@@ -68,17 +200,33 @@ def fetch_fragments_data(
     if not main_data_context:
         return []
 
-    existing_fragment_ids = set()
-    if existing_fragments_table:
-        existing_fragment_ids = {row["id"] for row in existing_fragments_table.rows}
+    existing_fragment_ids = _existing_values(existing_fragments_table, "id")
+
+    semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+    limiter = _RateLimiter()
+
+    async def scrape(
+        client: httpx.AsyncClient, pool: Optional[Executor], chapter: Dict[str, Any]
+    ) -> List[ContentPart]:
+        async with semaphore:
+            return await scrape_chapter_content(client, chapter["item_url"], pool, limiter)
+
+    # Downloads overlap in the event loop while the CPU-bound parsing fans out to worker
+    # processes, so parsing scales across cores instead of queuing behind the GIL.
+    pool = await _start_parse_pool()
+    try:
+        async with _new_client() as client:
+            scraped = await asyncio.gather(
+                *[scrape(client, pool, chapter) for chapter in main_data_context]
+            )
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     all_fragments = []
 
-    for chapter in main_data_context:
+    for chapter, paragraphs in zip(main_data_context, scraped):
         try:
-            # Scrape chapter content
-            paragraphs = scrape_chapter_content(chapter["item_url"])
-
             if paragraphs:
                 # Create fragments
                 fragments = create_content_fragments(paragraphs, chapter["id"])
@@ -89,8 +237,6 @@ def fetch_fragments_data(
                 all_fragments.extend(new_fragments)
                 print(f"Created {len(new_fragments)} fragments")
 
-            time.sleep(1)  # Be respectful
-
         except Exception as e:
             print(f"Error processing {chapter['title']}: {e}")
             continue
@@ -98,6 +244,17 @@ def fetch_fragments_data(
     return all_fragments
 
 
+def _existing_values(table: Optional[Table], column: str) -> set:
+    """Read one column of an existing table for deduplication.
+
+    Selects only that column so large fields such as fragment text are never loaded, and
+    iterates the cursor directly instead of building a dict per row.
+    """
+    if not table:
+        return set()
+    return {row[0] for row in table.db.execute(f"SELECT [{column}] FROM [{table.name}]")}
+
+
 def transform_data(raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Optional data transformation before database insertion."""
     return raw_data
@@ -125,162 +282,133 @@ def get_home_page_urls() -> List[tuple[str, str]]:
     ]
 
 
-def discover_chapter_links(section_url: str, section_name: str) -> List[Dict[str, Any]]:
+async def discover_chapter_links(
+    client: httpx.AsyncClient,
+    section_url: str,
+    section_name: str,
+    scraped_at: Optional[str] = None,
+    limiter: Optional[_RateLimiter] = None,
+) -> List[Dict[str, Any]]:
     """Find all chapter links within a section page."""
 
     try:
-        response = httpx.get(section_url, timeout=30.0)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        # Find all chapter links using the main wrapper selector
-        main_wrapper = soup.select(".edn_mainWrapper")
-        chapter_links = []
-
-        if main_wrapper:
-            links = main_wrapper[0].select("a")  # Use first main wrapper
-            for link in links:
-                href = link.get("href")
-                title = link.get_text(strip=True)
-
-                # Only include links that go deeper into About-Singapore-Law and have meaningful text
-                if (
-                    href
-                    and "About-Singapore-Law" in href
-                    and href != section_url  # Not the same page
-                    and len(title) > 5
-                ):  # Has meaningful title
-                    url_hash = hashlib.md5(href.encode()).hexdigest()[:12]
-                    chapter_links.append(
-                        {
-                            "id": url_hash,
-                            "item_url": href,
-                            "title": title,
-                            "section": section_name,
-                            "home_page": section_name,
-                            "last_scraped": time.strftime("%Y-%m-%d %H:%M:%S"),
-                            "content_length": 0,
-                        }
-                    )
-
-        return chapter_links
+        # Feed the body to the parser as it arrives instead of buffering the whole page
+        response = await _get(client, section_url, limiter, stream=True)
+        try:
+            response.raise_for_status()
+            parser = etree.HTMLPullParser(encoding=response.encoding)
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                parser.feed(chunk)
+            root = parser.close()
+        finally:
+            await response.aclose()
+        return parse_chapter_links(root, section_url, section_name, scraped_at)
 
     except Exception:
         return []
 
 
-def scrape_chapter_content(chapter_url: str) -> list[dict]:
-    """Extract main content from a chapter page, processing all content tags in order."""
+# Links inside the first .edn_mainWrapper element, selected in one compiled XPath query
+_CHAPTER_LINKS_XPATH = etree.XPath(
+    "(//*[contains(concat(' ', normalize-space(@class), ' '), ' edn_mainWrapper ')])[1]//a"
+)
 
-    try:
-        response = httpx.get(chapter_url, timeout=30.0)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
 
-        article = soup.select(".edn_article")[0]
+def parse_chapter_links(
+    root: Optional[etree._Element],
+    section_url: str,
+    section_name: str,
+    scraped_at: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Extract chapter records from a parsed section page."""
+    if scraped_at is None:
+        scraped_at = time.strftime("%Y-%m-%d %H:%M:%S")
+    chapter_links = []
 
-        # Get all content elements in order (paragraphs, tables, lists, etc.)
-        content_elements = article.find_all(
-            ["p", "table", "ul", "ol", "div", "h1", "h2", "h3", "h4", "h5", "h6"]
-        )
+    if root is not None:
+        # Find all chapter links using the main wrapper selector
+        links = _CHAPTER_LINKS_XPATH(root)
+        for link in links:
+            href = link.get("href")
+            title = get_text(link)
+
+            # Only include links that go deeper into About-Singapore-Law and have meaningful text
+            if (
+                href
+                and "About-Singapore-Law" in href
+                and href != section_url  # Not the same page
+                and len(title) > 5
+            ):  # Has meaningful title
+                # Chapter and fragment IDs are stored keys, so keep the MD5 scheme; it is an
+                # identifier, not a security check.
+                url_hash = hashlib.md5(href.encode(), usedforsecurity=False).hexdigest()[:12]
+                chapter_links.append(
+                    {
+                        "id": url_hash,
+                        "item_url": href,
+                        "title": title,
+                        "section": section_name,
+                        "home_page": section_name,
+                        "last_scraped": scraped_at,
+                        "content_length": 0,
+                    }
+                )
 
-        # Remove elements that are nested inside tables or lists to avoid duplicates
-        filtered_elements = []
-        for element in content_elements:
-            # Skip if this element is inside a table (we already capture table content)
-            if element.find_parent("table"):
-                continue
-            # Skip if this element is inside a ul/ol list (we already capture list content)
-            if element.find_parent(["ul", "ol"]):
-                continue
-            filtered_elements.append(element)
-
-        content_elements = filtered_elements
-
-        content_parts = []
-        for element in content_elements:
-            if element.name == "table":
-                # Extract table content as structured text
-                table_text = extract_table_text(element)
-                if table_text.strip():
-                    content_parts.append(
-                        {
-                            "text": table_text,
-                            "type": "table",
-                            "original_text": element.get_text(strip=True),
-                        }
-                    )
-            elif element.name in ["ul", "ol"]:
-                # Extract list content
-                list_text = extract_list_text(element)
-                if list_text.strip():
-                    content_parts.append(
-                        {
-                            "text": list_text,
-                            "type": "list",
-                            "original_text": element.get_text(strip=True),
-                        }
-                    )
-            elif element.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-                # Extract heading text
-                heading_text = element.get_text(strip=True)
-                if heading_text:
-                    content_parts.append(
-                        {"text": heading_text, "type": "heading", "original_text": heading_text}
-                    )
-            elif element.name in ["p", "div"]:
-                # Extract paragraph/div text - preserve original spacing for indentation check
-                original_text = str(element)
-                text = element.get_text(strip=True)
-                if text:
-                    content_parts.append(
-                        {"text": text, "type": "paragraph", "original_text": original_text}
-                    )
-
-        # Post-process to group consecutive indented paragraphs that should be list items
-        content_parts = group_pseudo_list_items(content_parts)
-
-        # Filter out footer content - stop processing when we hit footer markers
-        content_parts = filter_footer_content(content_parts)
-
-        for content in content_parts:
-            print(
-                f"[{content['type']}] {content['text'][:100]}{'...' if len(content['text']) > 100 else ''}"
-            )
+    return chapter_links
 
-        return content_parts
+
+async def scrape_chapter_content(
+    client: httpx.AsyncClient,
+    chapter_url: str,
+    executor: Optional[Executor] = None,
+    limiter: Optional[_RateLimiter] = None,
+) -> List[ContentPart]:
+    """Extract main content from a chapter page, processing all content tags in order.
+
+    Parsing runs in ``executor``, or the event loop's default thread pool if not given.
+    """
+
+    try:
+        response = await _get(client, chapter_url, limiter)
+        response.raise_for_status()
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, parse_chapter_content, response.content, response.encoding
+        )
 
     except Exception as e:
         print(f"Error scraping {chapter_url}: {e}")
-        return [{"text": "", "type": "paragraph", "original_text": ""}]
+        return [ContentPart(text="", type="paragraph", original_text="")]
+
+
+# Numbered paragraphs like "1.1.1", "1.2.15", etc. start a new fragment
+_NUMBERED_PARA_RE = re.compile(r"^(\d+\.\d+\.\d+)")
 
 
-def extract_table_text(table_element) -> str:
-    """Extract text content from a table element in a readable format."""
-    rows = []
-    for tr in table_element.find_all("tr"):
-        cells = []
-        for cell in tr.find_all(["td", "th"]):
-            cell_text = cell.get_text(strip=True)
-            cells.append(cell_text)
-        if cells:
-            rows.append(" | ".join(cells))
-    return "\n".join(rows)
+@dataclass(slots=True)
+class _Fragment:
+    """A fragment being assembled; converted to a row dict once complete.
 
+    Text pieces are buffered and joined once, rather than growing a string per append.
+    """
+
+    id: str
+    item_id: str
+    fragment_order: int
+    parts: List[str]
 
-def extract_list_text(list_element) -> str:
-    """Extract text content from list elements (ul/ol) in a readable format."""
-    items = []
-    for li in list_element.find_all("li", recursive=False):  # Only direct children
-        item_text = li.get_text(strip=True)
-        if item_text:
-            prefix = "- " if list_element.name == "ul" else "• "
-            items.append(f"{prefix}{item_text}")
-    return "\n".join(items)
+    def as_dict(self) -> Dict[str, Any]:
+        content_text = "\n\n".join(self.parts)
+        return {
+            "id": self.id,
+            "item_id": self.item_id,
+            "fragment_order": self.fragment_order,
+            "content_text": content_text,
+            "char_count": len(content_text),
+        }
 
 
 def create_content_fragments(
-    content_parts: List[Dict[str, Any]], chapter_id: str
+    content_parts: Iterable[ContentPart], chapter_id: str
 ) -> List[Dict[str, Any]]:
     """Split chapter content into searchable fragments.
 
@@ -291,51 +419,39 @@ def create_content_fragments(
     - Each fragment starts with a numbered paragraph (like 1.1.1)
     """
 
-    if not content_parts:
-        return []
-
-    import re
-
     fragments = []
     current_headers = []  # Collect headers until we hit a numbered paragraph
-    fragment_index = 0
     last_content_type = None  # Track the type of the previous content element
+    match_numbered = _NUMBERED_PARA_RE.match  # Bound once, called for every paragraph
 
-    # Regex to match numbered paragraphs like "1.1.1", "1.2.15", etc.
-    numbered_para_pattern = r"^\d+\.\d+\.\d+"
-
-    for i, content_part in enumerate(content_parts):
-        content_text = content_part["text"].strip()
-        content_type = content_part["type"]
-        original_text = content_part["original_text"]
+    for content_part in content_parts:
+        content_text = content_part.text.strip()
+        content_type = content_part.type
 
         if len(content_text) < 5:  # Skip very short content
             continue
 
-        # Check if this is a numbered paragraph
-        if content_type == "paragraph" and re.match(numbered_para_pattern, content_text):
+        # Check if this is a numbered paragraph (only paragraphs can start a fragment)
+        numbered_match = match_numbered(content_text) if content_type == "paragraph" else None
+        if numbered_match:
             # Start new fragment with any collected headers + this numbered paragraph
-            fragment_content_parts = current_headers + [content_text]
-            fragment_content = "\n\n".join(fragment_content_parts)
+            current_headers.append(content_text)
 
             # Extract the section number for the fragment ID
-            section_match = re.match(r"^(\d+\.\d+\.\d+)", content_text)
-            section_num = section_match.group(1) if section_match else f"f{fragment_index:03d}"
+            section_num = numbered_match.group(1)
             fragment_id = f"{chapter_id}_{section_num}"
 
             fragments.append(
-                {
-                    "id": fragment_id,
-                    "item_id": chapter_id,
-                    "fragment_order": fragment_index,
-                    "content_text": fragment_content,
-                    "char_count": len(fragment_content),
-                }
+                _Fragment(
+                    id=fragment_id,
+                    item_id=chapter_id,
+                    fragment_order=len(fragments),
+                    parts=current_headers,
+                )
             )
 
-            # Reset for next fragment
+            # The fragment now owns that list, so start a fresh one for the next fragment
             current_headers = []
-            fragment_index += 1
 
         elif content_type == "heading":
             # Headings get collected for the NEXT numbered paragraph
@@ -344,27 +460,21 @@ def create_content_fragments(
         elif content_type in ["table", "list"]:
             # Tables and lists attach to the PREVIOUS fragment (if exists)
             if fragments:
-                last_fragment = fragments[-1]
-                last_fragment["content_text"] += "\n\n" + content_text
-                last_fragment["char_count"] = len(last_fragment["content_text"])
+                fragments[-1].parts.append(content_text)
             else:
                 # No previous fragment - collect as header for next numbered paragraph
                 current_headers.append(content_text)
 
         elif content_type == "paragraph":
-            # Check if this paragraph is indented content (using original HTML)
-            is_indented = check_paragraph_indentation(original_text)
+            # Indentation is detected from the HTML when the page is parsed
+            is_indented = content_part.is_indented
 
             if is_indented and fragments:
                 # Attach to the previous (most recent) fragment
-                last_fragment = fragments[-1]
-                last_fragment["content_text"] += "\n\n" + content_text
-                last_fragment["char_count"] = len(last_fragment["content_text"])
+                fragments[-1].parts.append(content_text)
             elif not is_indented and last_content_type in ["table", "list"] and fragments:
                 # After a table or list, non-indented paragraphs attach to the previous fragment
-                last_fragment = fragments[-1]
-                last_fragment["content_text"] += "\n\n" + content_text
-                last_fragment["char_count"] = len(last_fragment["content_text"])
+                fragments[-1].parts.append(content_text)
             else:
                 # This is a regular paragraph - collect it as header for the next numbered paragraph
                 current_headers.append(content_text)
@@ -374,157 +484,6 @@ def create_content_fragments(
 
     # Handle any remaining headers at the end (attach to last fragment if exists)
     if current_headers and fragments:
-        last_fragment = fragments[-1]
-        additional_content = "\n\n".join(current_headers)
-        last_fragment["content_text"] += "\n\n" + additional_content
-        last_fragment["char_count"] = len(last_fragment["content_text"])
-
-    return fragments
-
-
-def check_paragraph_indentation(original_html: str) -> bool:
-    """Check if a paragraph has exactly 4 spaces of indentation in the original HTML."""
-    # Look for patterns indicating indentation in the original HTML
-    # This is a simplified check - you might need to adjust based on actual HTML structure
-    if "style=" in original_html and (
-        "margin-left" in original_html or "padding-left" in original_html
-    ):
-        return True
-    # Check for text that starts with 4 spaces when extracted
-    from bs4 import BeautifulSoup
-
-    soup = BeautifulSoup(original_html, "html.parser")
-    text_content = soup.get_text()
-    leading_spaces = len(text_content) - len(text_content.lstrip())
-    return leading_spaces == 4
-
-
-def is_likely_list_item(text: str) -> bool:
-    """Check if a paragraph text looks like it should be a list item."""
-    # Check for common list item patterns
-    stripped_text = text.strip()
-
-    # Starts with "the " and is likely a continuation of a list
-    if stripped_text.lower().startswith("the ") and len(stripped_text) > 20:
-        # Look for patterns common in legal list items
-        legal_patterns = [
-            "veto against",
-            "appointment of",
-            "concurrence with",
-            "withholding of",
-            "exercise of",
-            "approval of",
-            "consent to",
-            "power to",
-            "authority to",
-            "right to",
-            "duty to",
-            "responsibility for",
-        ]
-        return any(pattern in stripped_text.lower() for pattern in legal_patterns)
-
-    return False
-
-
-def group_pseudo_list_items(content_parts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Group consecutive paragraphs that should be list items into a single list."""
-    if not content_parts:
-        return content_parts
-
-    result = []
-    i = 0
-
-    while i < len(content_parts):
-        current = content_parts[i]
-
-        if current["type"] == "paragraph":
-            # Look ahead to see if we have consecutive list-like items
-            list_items = []
-            j = i
-
-            # Collect consecutive list-like paragraphs
-            while (
-                j < len(content_parts)
-                and content_parts[j]["type"] == "paragraph"
-                and is_likely_list_item(content_parts[j]["text"])
-            ):
-                list_items.append(content_parts[j]["text"])
-                j += 1
-
-            if len(list_items) >= 2:  # At least 2 consecutive list items
-                # Create a combined list
-                list_text = "\n".join(f"• {item}" for item in list_items)
-                result.append(
-                    {
-                        "text": list_text,
-                        "type": "list",
-                        "original_text": " ".join(
-                            item["original_text"] for item in content_parts[i:j]
-                        ),
-                    }
-                )
-                i = j  # Skip the items we just processed
-            else:
-                # Regular paragraph, keep as is
-                result.append(current)
-                i += 1
-        else:
-            # Non-paragraph, keep as is
-            result.append(current)
-            i += 1
-
-    return result
-
-
-def filter_footer_content(content_parts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Stop processing when we hit footer markers to avoid capturing navigation/metadata."""
-    if not content_parts:
-        return content_parts
-
-    filtered_parts = []
-    footer_markers = [
-        "updated as at",
-        "by:",
-        "disclaimer:",
-        "@singaporelawwatch.sg",
-        "email protected",
-        "the writers wish to acknowledge",
-    ]
+        fragments[-1].parts.extend(current_headers)
 
-    for i, part in enumerate(content_parts):
-        text_lower = part["text"].lower().strip()
-
-        # Check if this content part contains footer markers
-        is_footer = False
-        for marker in footer_markers:
-            if marker in text_lower:
-                is_footer = True
-                break
-
-        # More specific checks for different footer patterns
-        if not is_footer:
-            # Skip the first element if it's a chapter title (legitimate content)
-            if i == 0 and part["type"] == "heading" and text_lower.startswith("ch. "):
-                is_footer = False  # Keep chapter titles
-            # Check for navigation links that appear later (not at the start)
-            elif i > 10 and "ch. " in text_lower and len(text_lower) < 100:
-                # Navigation pattern like "Ch. 01 The Singapore Legal SystemCh. 03 Mediation"
-                if text_lower.count("ch. ") >= 2:
-                    is_footer = True
-            # Check for standalone "print" or "tags:" that appear later
-            elif i > 10 and (text_lower == "print" or text_lower.startswith("tags:")):
-                is_footer = True
-            # Check for standalone numbers that might be page counts/IDs (but not section numbers)
-            elif i > 10 and text_lower.isdigit() and len(text_lower) > 3:
-                is_footer = True
-            # Check for references section (usually at the end)
-            elif i > 10 and text_lower.startswith("references"):
-                is_footer = True
-
-        # If we hit footer content, stop processing here
-        if is_footer:
-            break
-
-        filtered_parts.append(part)
-
-    return filtered_parts
+    return [fragment.as_dict() for fragment in fragments]
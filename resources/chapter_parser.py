@@ -0,0 +1,348 @@
+"""
+Chapter page parsing for the about_singapore_law resource.
+
+Kept in its own module so the parse worker processes can import parse_chapter_content by
+name; zeeker loads resource modules by file path, which worker processes can't import.
+"""
+
+import logging
+import re
+from io import BytesIO
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+
+class ContentPart(NamedTuple):
+    """One piece of a chapter's content, in document order."""
+
+    text: str
+    type: str  # "paragraph", "heading", "table" or "list"
+    original_text: str
+    is_indented: bool = False
+
+
+# Elements extracted from a chapter article, in document order
+CONTENT_TAGS = frozenset({"p", "table", "ul", "ol", "div", "h1", "h2", "h3", "h4", "h5", "h6"})
+HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+LIST_TAGS = frozenset({"ul", "ol"})
+# Only these elements need iterparse events: the content tags plus the containers the
+# .edn_article class is expected on. Skipping the rest (spans, links, cells, navigation)
+# avoids creating a Python object for every other element on the page. A page that puts the
+# class on any other element is parsed again with events for every element.
+_EVENT_TAGS = CONTENT_TAGS | {"article", "section", "main"}
+# Elements whose text is code rather than content (bs4's get_text skips these too)
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+# Text marking the author/metadata block at the end of a chapter
+FOOTER_MARKERS = (
+    "updated as at",
+    "by:",
+    "disclaimer:",
+    "@singaporelawwatch.sg",
+    "email protected",
+    "the writers wish to acknowledge",
+)
+# All markers in one alternation, so each part is scanned once rather than once per marker
+_FOOTER_RE = re.compile("|".join(re.escape(marker) for marker in FOOTER_MARKERS))
+
+
+def parse_chapter_content(content: bytes, encoding: Optional[str] = None) -> List[ContentPart]:
+    """Extract the content parts of a chapter page's HTML in document order.
+
+    The page is streamed through lxml's iterparse. Open tables and lists are counted from
+    start/end events, so elements nested inside them (whose text the table or list already
+    captures) are skipped without walking up their ancestors.
+    """
+    content_parts = _article_parts(content, encoding, _EVENT_TAGS)
+    if content_parts is None:
+        # .edn_article sits on an element outside _EVENT_TAGS, so look at every element
+        content_parts = _article_parts(content, encoding, None)
+    if content_parts is None:
+        raise ValueError("No .edn_article element found")
+
+    # Drop empty elements, group consecutive indented paragraphs that should be list items,
+    # and stop at the footer, in one pass. The result is built as a list because it is sent
+    # back from the parse worker process.
+    content_parts = list(
+        filter_footer_content(
+            group_pseudo_list_items(part for part in content_parts if part is not None)
+        )
+    )
+
+    # Skip formatting a line per part entirely unless debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        for content in content_parts:
+            logger.debug(
+                "[%s] %.100s%s",
+                content.type,
+                content.text,
+                "..." if len(content.text) > 100 else "",
+            )
+
+    return content_parts
+
+
+def _article_parts(
+    content: bytes, encoding: Optional[str], tags: Optional[Iterable[str]]
+) -> Optional[List[Optional[ContentPart]]]:
+    """Collect the content parts inside the page's .edn_article element, in document order.
+
+    Only ``tags`` elements are looked at (all elements if None). Returns None if no
+    .edn_article element was found among them; empty elements are left as None parts.
+    """
+    article = None
+    open_tables = 0
+    open_lists = 0
+    # Parts are reserved at an element's start tag so they keep document order, and filled
+    # in at its end tag once its text has been parsed.
+    content_parts = []
+    pending = {}
+
+    events = etree.iterparse(
+        BytesIO(content),
+        events=("start", "end"),
+        tag=tags,
+        html=True,
+        encoding=encoding,
+    )
+    for event, element in events:
+        tag = element.tag
+
+        if event == "start":
+            if article is None:
+                if "edn_article" in (element.get("class") or "").split():
+                    article = element
+            elif tag in CONTENT_TAGS and not open_tables and not open_lists:
+                pending[element] = len(content_parts)
+                content_parts.append(None)
+
+            if tag == "table":
+                open_tables += 1
+            elif tag in LIST_TAGS:
+                open_lists += 1
+            continue
+
+        if tag == "table":
+            open_tables -= 1
+        elif tag in LIST_TAGS:
+            open_lists -= 1
+
+        if element is article:
+            break
+
+        index = pending.pop(element, None)
+        if index is not None:
+            content_parts[index] = _to_content_part(element)
+            if not pending:
+                # Nothing still open needs this subtree's text, so free it
+                element.clear(keep_tail=True)
+
+    return content_parts if article is not None else None
+
+
+def _to_content_part(element) -> Optional[ContentPart]:
+    """Convert a content element into a content part, or None if it has no text."""
+    tag = element.tag
+    if tag == "table":
+        # Extract table content as structured text, from one walk of the table's text
+        texts = _subtree_texts(element)
+        table_text = extract_table_text(element, texts)
+        if table_text.strip():
+            return ContentPart(text=table_text, type="table", original_text=texts[element])
+    elif tag in LIST_TAGS:
+        # Extract list content, from one walk of the list's text
+        texts = _subtree_texts(element)
+        list_text = extract_list_text(element, texts)
+        if list_text.strip():
+            return ContentPart(text=list_text, type="list", original_text=texts[element])
+    elif tag in HEADING_TAGS:
+        # Extract heading text
+        heading_text = get_text(element)
+        if heading_text:
+            return ContentPart(text=heading_text, type="heading", original_text=heading_text)
+    else:
+        # Extract paragraph/div text, noting indentation while the element is at hand
+        strings = list(_iter_text(element))
+        text = "".join(string.strip() for string in strings)
+        if text:
+            original_text = etree.tostring(
+                element, encoding="unicode", method="html", with_tail=False
+            )
+            return ContentPart(
+                text=text,
+                type="paragraph",
+                original_text=original_text,
+                is_indented=_is_indented(element, "".join(strings)),
+            )
+    return None
+
+
+def _is_indented(element, raw_text: str) -> bool:
+    """Check if a paragraph is indented by a left margin/padding or exactly 4 leading spaces."""
+    for node in element.iter():
+        style = node.get("style") if isinstance(node.tag, str) else None
+        if style and ("margin-left" in style or "padding-left" in style):
+            return True
+    # Exactly four leading whitespace characters, checked without copying the text as
+    # lstrip() would
+    return len(raw_text) >= 4 and raw_text[:4].isspace() and not raw_text[4:5].isspace()
+
+
+def _iter_text(element) -> Iterator[str]:
+    """Yield the text nodes under an element in document order, skipping comments and code."""
+    if isinstance(element.tag, str) and element.tag not in _NON_TEXT_TAGS and element.text:
+        yield element.text
+    for child in element:
+        yield from _iter_text(child)
+        if child.tail:
+            yield child.tail
+
+
+def get_text(element) -> str:
+    """Join the stripped text nodes under an element, like bs4's get_text(strip=True)."""
+    return "".join(text.strip() for text in _iter_text(element))
+
+
+def _subtree_texts(element) -> Dict[Any, str]:
+    """Map an element and every node under it to its get_text() value, in a single walk.
+
+    An element's text is its own text followed by each child's text and tail, so each
+    value is built from its children's instead of walking every subtree again.
+    """
+    texts = {}
+
+    def visit(node) -> str:
+        pieces = []
+        if isinstance(node.tag, str) and node.tag not in _NON_TEXT_TAGS and node.text:
+            pieces.append(node.text.strip())
+        for child in node:
+            pieces.append(visit(child))
+            if child.tail:
+                pieces.append(child.tail.strip())
+        text = texts[node] = "".join(pieces)
+        return text
+
+    visit(element)
+    return texts
+
+
+def extract_table_text(table_element, texts: Optional[Dict[Any, str]] = None) -> str:
+    """Extract text content from a table element in a readable format."""
+    if texts is None:
+        texts = _subtree_texts(table_element)
+    rows = []
+    for tr in table_element.iter("tr"):
+        cells = [texts[cell] for cell in tr.iter("td", "th")]
+        if cells:
+            rows.append(" | ".join(cells))
+    return "\n".join(rows)
+
+
+def extract_list_text(list_element, texts: Optional[Dict[Any, str]] = None) -> str:
+    """Extract text content from list elements (ul/ol) in a readable format."""
+    if texts is None:
+        texts = _subtree_texts(list_element)
+    items = []
+    for li in list_element.iterchildren("li"):  # Only direct children
+        item_text = texts[li]
+        if item_text:
+            prefix = "- " if list_element.tag == "ul" else "• "
+            items.append(f"{prefix}{item_text}")
+    return "\n".join(items)
+
+
+# Phrases common in legal list items, e.g. "the power to appoint ..."
+_LEGAL_PATTERNS_RE = re.compile(
+    r"\b(?:veto against|appointment of|concurrence with|withholding of|exercise of"
+    r"|approval of|consent to|power to|authority to|right to|duty to|responsibility for)\b"
+)
+
+
+def is_likely_list_item(text: str) -> bool:
+    """Check if a paragraph text looks like it should be a list item."""
+    # Check for common list item patterns
+    stripped_text = text.strip()
+    if len(stripped_text) <= 20:
+        return False
+
+    # Starts with "the " and is likely a continuation of a list
+    text_lower = stripped_text.lower()
+    if text_lower.startswith("the "):
+        return _LEGAL_PATTERNS_RE.search(text_lower) is not None
+
+    return False
+
+
+def group_pseudo_list_items(content_parts: Iterable[ContentPart]) -> Iterator[ContentPart]:
+    """Group consecutive paragraphs that should be list items into a single list.
+
+    Parts are consumed and yielded as a stream, holding back only the current run of
+    list-like paragraphs.
+    """
+    run = []  # Consecutive list-like paragraphs seen so far
+
+    for part in content_parts:
+        if part.type == "paragraph" and is_likely_list_item(part.text):
+            run.append(part)
+            continue
+        if run:
+            yield from _flush_list_run(run)
+            run = []
+        # Non-list content, keep as is
+        yield part
+
+    if run:
+        yield from _flush_list_run(run)
+
+
+def _flush_list_run(run: List[ContentPart]) -> Iterator[ContentPart]:
+    """Yield a run of list-like paragraphs as one list, or as-is if it is a lone paragraph."""
+    if len(run) >= 2:  # At least 2 consecutive list items
+        # Create a combined list
+        yield ContentPart(
+            text="\n".join(f"• {item.text}" for item in run),
+            type="list",
+            original_text=" ".join(item.original_text for item in run),
+        )
+    else:
+        # Regular paragraph, keep as is
+        yield from run
+
+
+def filter_footer_content(content_parts: Iterable[ContentPart]) -> Iterator[ContentPart]:
+    """Stop processing when we hit footer markers to avoid capturing navigation/metadata."""
+    for i, part in enumerate(content_parts):
+        text_lower = part.text.lower().strip()
+        len_lower = len(text_lower)
+
+        # Check if this content part contains footer markers
+        is_footer = _FOOTER_RE.search(text_lower) is not None
+
+        # More specific checks for different footer patterns
+        if not is_footer:
+            # Skip the first element if it's a chapter title (legitimate content)
+            if i == 0 and part.type == "heading" and text_lower.startswith("ch. "):
+                is_footer = False  # Keep chapter titles
+            # Check for navigation links that appear later (not at the start)
+            elif i > 10 and "ch. " in text_lower and len_lower < 100:
+                # Navigation pattern like "Ch. 01 The Singapore Legal SystemCh. 03 Mediation"
+                if text_lower.count("ch. ") >= 2:
+                    is_footer = True
+            # Check for standalone "print" or "tags:" that appear later
+            elif i > 10 and (text_lower == "print" or text_lower.startswith("tags:")):
+                is_footer = True
+            # Check for standalone numbers that might be page counts/IDs (but not section numbers)
+            elif i > 10 and text_lower.isdigit() and len_lower > 3:
+                is_footer = True
+            # Check for references section (usually at the end)
+            elif i > 10 and text_lower.startswith("references"):
+                is_footer = True
+
+        # If we hit footer content, stop processing here
+        if is_footer:
+            return
+
+        yield part
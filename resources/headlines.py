@@ -3,40 +3,165 @@ Headlines resource for fetching Singapore Law Watch Headlines RSS feed.
 """
 
 import asyncio
+import contextlib
+import hashlib
 import os
-from datetime import datetime
-from typing import Dict, Optional
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
 
 import click
 import feedparser
 import httpx
-from sqlite_utils.db import Table
-from tenacity import retry, stop_after_attempt, wait_exponential
+from sqlite_utils.db import Database, Table
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
-HEADLINES_URL = "https://www.singaporelawwatch.sg/Portals/0/RSS/Headlines.xml"
-
-# Limit concurrent LLM calls — local Ollama handles one at a time and will
-# queue requests. Without this, all 70+ headlines fire simultaneously and
-# most time-out waiting in the queue.
-# Lazy-init so the semaphore binds to whichever event loop runs first,
-# not the import-time loop (which may differ from the asyncio.run() loop).
-_LLM_SEMAPHORE: Optional[asyncio.Semaphore] = None
+from http_helpers import new_client, retry_after_seconds
 
+HEADLINES_URL = "https://www.singaporelawwatch.sg/Portals/0/RSS/Headlines.xml"
 
-def _get_llm_semaphore() -> asyncio.Semaphore:
-    global _LLM_SEMAPHORE
-    if _LLM_SEMAPHORE is None:
-        _LLM_SEMAPHORE = asyncio.Semaphore(3)
-    return _LLM_SEMAPHORE
+# Source URLs that Jina Reader can't handle, so their content isn't requested:
+# these hosts return 422s, and URLs with tracking parameters sometimes fail
+_SKIP_JINA_HOSTS = frozenset({"store.lawnet.com"})
+_SKIP_JINA_QUERY_MARKER = "utm_source="
+
+# Number of entries processed at once, and the cap on concurrent Jina reader requests
+HEADLINES_CONCURRENCY = int(os.environ.get("HEADLINES_CONCURRENCY", "8"))
+# Cap on concurrent LLM calls, and the number of summary workers in the pipeline. Local
+# Ollama handles one request at a time and queues the rest, so firing every headline at
+# once leaves most of them timing out in its queue.
+LLM_CONCURRENCY = 3
+
+# Jina reader text, LLM summaries and the feed's validators are cached in a SQLite file of
+# their own rather than the project database, which is published as-is. It sits beside the
+# HTTP cache that the build workflow carries between CI runs. Set to an empty string to
+# disable caching.
+CACHE_PATH = os.environ.get("HEADLINES_CACHE", ".http_cache/headlines.db")
+# Jina reader responses are keyed by a hash of the article URL, so re-runs (e.g. after a
+# build aborted on LLM failures) don't pay to fetch them again.
+JINA_CACHE_TABLE = "_jina_cache"
+JINA_CACHE_TTL_DAYS = 30
+# LLM summaries are cached by a hash of prompt, model and article text, so the same
+# article is never billed twice.
+SUMMARY_CACHE_TABLE = "_summary_cache"
+# The feed's ETag/Last-Modified from the last fully processed run, sent back as a
+# conditional GET so an unchanged feed answers 304 instead of being downloaded again.
+FEED_STATE_TABLE = "_feed_state"
 
 SYSTEM_PROMPT_TEXT = """
 As an expert in legal affairs, your task is to provide summaries of legal news articles for time-constrained attorneys in an engaging, conversational style. These summaries should highlight the critical legal aspects, relevant precedents, and implications of the issues discussed in the articles. The summary should be in 1 narrative paragraph and should not be longer than 100 words, but ensure they efficiently deliver the key legal insights, making them beneficial for quick comprehension. The end goal is to help the lawyers understand the crux of the articles without having to read them in their entirety.
 """
 
+# Built once: every summary request sends the same system message
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT_TEXT}
+# Stands in for the full prompt in summary cache keys; changing the prompt still invalidates them
+_SYSTEM_PROMPT_FINGERPRINT = hashlib.md5(
+    SYSTEM_PROMPT_TEXT.encode(), usedforsecurity=False
+).hexdigest()
+
+
+def _new_jina_client() -> httpx.AsyncClient:
+    """Build the client shared by all Jina reader requests in one run."""
+    return new_client(
+        timeout=90, limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    )
+
+
+def _new_article_client() -> httpx.AsyncClient:
+    """Build the client shared by all backfill article fetches in one run."""
+    return new_client(timeout=30, follow_redirects=True)
+
+
+def _open_cache_db() -> Optional[Database]:
+    """Open the headlines cache database, or return None if caching is disabled."""
+    if not CACHE_PATH:
+        return None
+    os.makedirs(os.path.dirname(CACHE_PATH) or ".", exist_ok=True)
+    return Database(CACHE_PATH)
+
+
+def _drop_published_cache_tables(db: Database) -> None:
+    """Drop the cache tables earlier versions kept in the published project database."""
+    for name in (JINA_CACHE_TABLE, SUMMARY_CACHE_TABLE, FEED_STATE_TABLE):
+        db[name].drop(ignore=True)
+
+
+def _get_cached_jina_content(db: Database, link: str) -> Optional[str]:
+    """Return cached Jina reader text for a link, or None if missing or expired."""
+    if not db[JINA_CACHE_TABLE].exists():
+        return None
+    row = db.execute(
+        f"SELECT text, fetched_at FROM [{JINA_CACHE_TABLE}] WHERE url_hash = ?",
+        [get_hash_id([link])],
+    ).fetchone()
+    if not row:
+        return None
+    text, fetched_at = row
+    if datetime.fromisoformat(fetched_at) < datetime.now() - timedelta(days=JINA_CACHE_TTL_DAYS):
+        return None
+    return text
+
+
+def _cache_jina_content(db: Database, link: str, text: str) -> None:
+    """Store Jina reader text for a link, replacing any earlier copy."""
+    db[JINA_CACHE_TABLE].insert(
+        {"url_hash": get_hash_id([link]), "text": text, "fetched_at": datetime.now().isoformat()},
+        pk="url_hash",
+        replace=True,
+    )
+
+
+# Jittered backoff so concurrent requests rate-limited together don't all retry in lockstep
+_jina_backoff = wait_exponential_jitter(initial=1, max=30)
+
+
+def _is_retryable_jina_error(error: BaseException) -> bool:
+    """Retry network errors, rate limiting and server errors, but not other 4xx responses."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.RequestError)
+
+
+def _jina_retry_wait(retry_state: RetryCallState) -> float:
+    """Wait as long as a 429's Retry-After header asks, else back off with jitter."""
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429:
+        seconds = retry_after_seconds(error.response)
+        if seconds is not None:
+            return seconds
+    return _jina_backoff(retry_state)
+
+
+@retry(
+    stop=stop_after_attempt(5),
+    wait=_jina_retry_wait,
+    retry=retry_if_exception(_is_retryable_jina_error),
+    reraise=True,
+)
+async def get_jina_reader_content(
+    link: str,
+    client: Optional[httpx.AsyncClient] = None,
+    cache_db: Optional[Database] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> str:
+    """Fetch content from the Jina reader link.
+
+    ``client`` is the run's shared Jina client; without one, a client is opened for this
+    request alone. Pass ``cache_db`` to serve and store the text in its Jina cache table,
+    and ``semaphore`` to cap how many requests the caller's run has in flight at once.
+    """
+    if cache_db is not None:
+        cached = _get_cached_jina_content(cache_db, link)
+        if cached is not None:
+            return cached
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=2, min=1, max=10))
-async def get_jina_reader_content(link: str) -> str:
-    """Fetch content from the Jina reader link."""
     jina_token = os.environ.get("JINA_API_TOKEN")
     if not jina_token:
         click.echo("JINA_API_TOKEN environment variable not set", err=True)
@@ -48,31 +173,82 @@ async def get_jina_reader_content(link: str) -> str:
         "X-Target-Selector": "article",
     }
     try:
-        async with httpx.AsyncClient(timeout=90) as client:
-            r = await client.get(jina_link, headers=headers)
-            r.raise_for_status()  # Raises httpx.HTTPStatusError for 4xx/5xx responses
+        async with semaphore or contextlib.nullcontext():
+            if client is not None:
+                r = await client.get(jina_link, headers=headers)
+            else:
+                async with _new_jina_client() as own_client:
+                    r = await own_client.get(jina_link, headers=headers)
+        r.raise_for_status()  # Raises httpx.HTTPStatusError for 4xx/5xx responses
+        if cache_db is not None and r.text:
+            _cache_jina_content(cache_db, link, r.text)
         return r.text
     except (httpx.RequestError, httpx.HTTPStatusError) as e:
         click.echo(f"Error fetching content from Jina reader: {e}", err=True)
         raise
 
 
-async def get_summary(text: str) -> str:
+def _get_cached_summary(db: Database, key: str) -> Optional[str]:
+    """Return the cached summary for a cache key, or None."""
+    if not db[SUMMARY_CACHE_TABLE].exists():
+        return None
+    row = db.execute(
+        f"SELECT summary FROM [{SUMMARY_CACHE_TABLE}] WHERE hash = ?", [key]
+    ).fetchone()
+    return row[0] if row else None
+
+
+def _cache_summary(db: Database, key: str, summary: str) -> None:
+    """Store a summary under its cache key."""
+    db[SUMMARY_CACHE_TABLE].insert({"hash": key, "summary": summary}, pk="hash", replace=True)
+
+
+def _get_feed_validators(db: Database, url: str) -> tuple[Optional[str], Optional[str]]:
+    """Return the stored (etag, modified) for a feed URL, or (None, None)."""
+    if not db[FEED_STATE_TABLE].exists():
+        return None, None
+    row = db.execute(
+        f"SELECT etag, modified FROM [{FEED_STATE_TABLE}] WHERE url = ?", [url]
+    ).fetchone()
+    return (row[0], row[1]) if row else (None, None)
+
+
+def _save_feed_validators(
+    db: Database, url: str, etag: Optional[str], modified: Optional[str]
+) -> None:
+    """Store a feed URL's etag and modified values, replacing any earlier ones."""
+    db[FEED_STATE_TABLE].insert(
+        {"url": url, "etag": etag, "modified": modified}, pk="url", replace=True
+    )
+
+
+async def get_summary(
+    text: str,
+    cache_db: Optional[Database] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> str:
     """Generate a summary of the article text using any OpenAI-compatible LLM server.
 
     Supports local Ollama instances on Tailscale via TAILSCALE_PROXY (socks5h://...).
+    Pass ``cache_db`` to serve and store summaries in its summary cache table, and
+    ``semaphore`` to cap how many LLM calls the caller's run has in flight at once.
     """
     base_url = os.environ.get("LLM_BASE_URL", "https://api.openai.com/v1")
     api_key = os.environ.get("LLM_API_KEY", "")
     model = os.environ.get("LLM_MODEL", "gpt-4.1-mini")
     tailscale_proxy = os.environ.get("TAILSCALE_PROXY", "")
 
+    user_message = f"Here is an article to summarise:\n {text[:4000]}"
+    cache_key = get_hash_id([_SYSTEM_PROMPT_FINGERPRINT, model, user_message])
+    if cache_db is not None:
+        cached = _get_cached_summary(cache_db, cache_key)
+        if cached is not None:
+            return cached
+
     if not base_url:
         click.echo("LLM_BASE_URL not set — skipping summary", err=True)
         return ""
 
-    from openai import AsyncOpenAI
-
     # Route through Tailscale SOCKS5 proxy if set — needed to reach local Ollama
     # instances on the Tailscale network (e.g. houfus-macbook-pro:11434)
     http_client = None
@@ -84,6 +260,10 @@ async def get_summary(text: str) -> str:
         except Exception as e:
             click.echo(f"  → Tailscale proxy setup failed: {e} — falling back to direct", err=True)
 
+    # Imported here rather than at module level: openai takes far longer to import than
+    # the rest of this module, and runs whose summaries all come from cache never need it
+    from openai import AsyncOpenAI
+
     client = AsyncOpenAI(
         base_url=base_url,
         api_key=api_key or "ollama",
@@ -92,18 +272,17 @@ async def get_summary(text: str) -> str:
         http_client=http_client,
     )
     try:
-        async with _get_llm_semaphore():
+        async with semaphore or contextlib.nullcontext():
             response = await client.chat.completions.create(
                 model=model,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT_TEXT},
-                    {"role": "user", "content": f"Here is an article to summarise:\n {text[:4000]}"},
-                ],
+                messages=[_SYSTEM_MESSAGE, {"role": "user", "content": user_message}],
             )
         content = response.choices[0].message.content
         if not content:
             finish_reason = response.choices[0].finish_reason
             raise ValueError(f"LLM returned empty content (finish_reason={finish_reason})")
+        if cache_db is not None:
+            _cache_summary(cache_db, cache_key, content)
         return content
     except Exception as e:
         click.echo(f"Error generating summary from LLM: {e}", err=True)
@@ -130,99 +309,214 @@ def get_hash_id(elements: list[str], delimiter: str = "|") -> str:
         >>> get_hash_id(["user123", "login", "192.168.1.1"], delimiter=":")
         '7h8i9j0k1l2m3n4o5p6q'
     """
-    import hashlib
-
     if not elements:
         raise ValueError("At least one element is required")
 
-    joined_string = delimiter.join(str(element) for element in elements)
-    return hashlib.md5(joined_string.encode()).hexdigest()
-
-
-def convert_date_to_iso(date_str: str) -> str:
-    """Convert date string like '08 May 2025 00:01:00' to ISO format."""
+    # Stored headline IDs are MD5 digests and dedup compares against them, so the algorithm
+    # stays MD5. It is an identifier, not a security check.
+    digest = hashlib.md5(usedforsecurity=False)
+    # Feed the elements in one at a time instead of building the joined string first;
+    # the digest is the same as hashing delimiter.join(elements)
+    separator = delimiter.encode()
+    first, *rest = elements
+    digest.update(str(first).encode())
+    for element in rest:
+        digest.update(separator)
+        digest.update(str(element).encode())
+    return digest.hexdigest()
+
+
+# Month numbers by lower-cased English name and abbreviation, for the feed's date format
+_MONTH_NAMES = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+_MONTHS = {
+    **{name: number for number, name in enumerate(_MONTH_NAMES, start=1)},
+    **{name[:3]: number for number, name in enumerate(_MONTH_NAMES, start=1)},
+}
+
+
+def parse_headline_date(date_str: str, now_fn: Optional[Callable[[], datetime]] = None) -> datetime:
+    """Parse a feed date string like '08 May 2025 00:01:00' into a datetime.
+
+    Unparseable strings fall back to ``now_fn()`` (default ``datetime.now``).
+    """
+    # Fast path: split the fixed 'day month year HH:MM:SS' layout by hand, which is much
+    # cheaper than strptime; anything unexpected drops through to strptime below
+    try:
+        day, month, year, clock = date_str.split(" ")
+        hour, minute, second = clock.split(":")
+        return datetime(
+            int(year), _MONTHS[month.lower()], int(day), int(hour), int(minute), int(second)
+        )
+    except (KeyError, ValueError):
+        pass
     try:
-        parsed_date = datetime.strptime(date_str, "%d %B %Y %H:%M:%S")
-        return parsed_date.isoformat()  # Returns '2025-05-08T00:01:00'
+        return datetime.strptime(date_str, "%d %B %Y %H:%M:%S")
     except ValueError:
         # Handle potential parsing errors
         try:
             # Try alternative format with abbreviated month name
-            parsed_date = datetime.strptime(date_str, "%d %b %Y %H:%M:%S")
-            return parsed_date.isoformat()
+            return datetime.strptime(date_str, "%d %b %Y %H:%M:%S")
         except ValueError:
-            # If all parsing attempts fail, return original or a default
-            return datetime.now().isoformat()
+            # If all parsing attempts fail, fall back to now
+            return (now_fn or datetime.now)()
 
 
-async def process_entry(entry: Dict) -> Optional[Dict]:
-    """Process an entry from the RSS feed to extract necessary data.
+def convert_date_to_iso(date_str: str, now_fn: Optional[Callable[[], datetime]] = None) -> str:
+    """Convert date string like '08 May 2025 00:01:00' to ISO format."""
+    return parse_headline_date(date_str, now_fn).isoformat()  # Returns '2025-05-08T00:01:00'
 
-    Returns a dict with entry data. Internal flags ``_jina_failed`` and
-    ``_openai_failed`` track failures so the caller can abort on high error rates.
+
+def _should_skip_jina(url: str) -> bool:
+    """Check whether a source URL is one Jina Reader is known to fail on."""
+    try:
+        parts = urlsplit(url)
+        return parts.hostname in _SKIP_JINA_HOSTS or _SKIP_JINA_QUERY_MARKER in parts.query
+    except ValueError:
+        # Malformed URL: let Jina try it and fall back if that fails
+        return False
+
+
+def _fallback_summary(title: str) -> str:
+    """Build a summary from a truncated title when no LLM summary is available."""
+    return f"Legal news article: {title[:100]}{'...' if len(title) > 100 else ''}"
+
+
+async def _prepare_entry(
+    entry: Dict,
+    client: Optional[httpx.AsyncClient] = None,
+    cache_db: Optional[Database] = None,
+    entry_date: Optional[datetime] = None,
+    imported_on: Optional[str] = None,
+    jina_semaphore: Optional[asyncio.Semaphore] = None,
+) -> Optional[Dict]:
+    """Build an entry's row and fetch its article text — the first stage of process_entry.
+
+    Sets the internal ``_jina_failed`` flag when the fallback content was used.
+    Returns None if the entry could not be processed.
     """
     try:
-        # Convert ISO date string to datetime object
-        entry_date = datetime.fromisoformat(convert_date_to_iso(entry["published"]))
+        if entry_date is None:
+            entry_date = parse_headline_date(entry["published"])
 
+        title = entry["title"]
+        source_url = entry.get("link", "")
+        date = entry_date.isoformat()
         # Always use deterministic hash ID (RSS feed IDs are often empty or inconsistent)
-        article_id = get_hash_id([entry_date.isoformat(), entry["title"]])
+        article_id = get_hash_id([date, title])
         # Prepare entry data dictionary
         entry_data = {
             "id": article_id,
             "category": entry.get("category", ""),
-            "title": entry.get("title", ""),
-            "source_link": entry.get("link", ""),
+            "title": title,
+            "source_link": source_url,
             "author": entry.get("author", ""),
-            "date": entry_date.isoformat(),
-            "imported_on": datetime.now().isoformat(),
+            "date": date,
+            "imported_on": imported_on or datetime.now().isoformat(),
         }
 
         # Fetch content from Jina reader with graceful fallback
-        click.echo(f"Processing: {entry_data['title']} from {entry_data['date']}")
+        click.echo(f"Processing: {title} from {date}")
 
         # Check if URL is problematic (some URLs cause 422 errors with Jina Reader)
-        source_url = entry_data["source_link"]
-        skip_jina = any(pattern in source_url for pattern in [
-            'store.lawnet.com',  # Known to cause 422 errors
-            'utm_source=',       # URLs with tracking parameters sometimes fail
-        ])
+        skip_jina = _should_skip_jina(source_url)
 
         jina_failed = False
         try:
             if skip_jina:
                 click.echo(f"  → Skipping Jina Reader for problematic URL pattern")
                 raise Exception("URL pattern known to cause issues")
-            entry_data["text"] = await get_jina_reader_content(source_url)
+            entry_data["text"] = await get_jina_reader_content(
+                source_url, client, cache_db, jina_semaphore
+            )
         except Exception as jina_error:
             jina_failed = True
             click.echo(f"  → Jina Reader failed: {jina_error}", err=True)
-            # Use fallback: title as content for summary generation
-            entry_data["text"] = f"Article: {entry_data['title']}\nSource: {source_url}\n\nContent could not be retrieved from source."
-            click.echo(f"  → Using fallback content for summary generation")
+            # Use fallback: title as content
+            entry_data["text"] = (
+                f"Article: {title}\nSource: {source_url}\n\nContent could not be retrieved from source."
+            )
+            click.echo(f"  → Using fallback content")
+
+        entry_data["_jina_failed"] = jina_failed
+        return entry_data
+    except Exception as e:
+        click.echo(f"Error processing entry '{entry.get('title', 'Unknown')}': {e}", err=True)
+        return None
+
+
+async def _summarise_entry(
+    entry_data: Dict,
+    cache_db: Optional[Database] = None,
+    llm_semaphore: Optional[asyncio.Semaphore] = None,
+) -> Dict:
+    """Add the summary to a prepared entry — the second stage of process_entry.
 
+    Sets the internal ``_llm_failed`` flag when the LLM call failed.
+    """
+    title = entry_data["title"]
+    llm_failed = False
+    if entry_data.get("_jina_failed"):
+        # The placeholder text holds nothing the title doesn't, so don't spend an LLM call on it
+        entry_data["summary"] = _fallback_summary(title)
+        click.echo("  → Using fallback summary (no article content)")
+    else:
         # Generate summary using LLM
-        click.echo(f"  → Generating summary for: {entry_data['title']}")
-        llm_failed = False
+        click.echo(f"  → Generating summary for: {title}")
         try:
-            entry_data["summary"] = await get_summary(entry_data["text"])
+            entry_data["summary"] = await get_summary(entry_data["text"], cache_db, llm_semaphore)
         except Exception as summary_error:
             llm_failed = True
             click.echo(f"  → Summary generation failed: {summary_error}", err=True)
-            # Fallback: use truncated title as summary
-            entry_data["summary"] = f"Legal news article: {entry_data['title'][:100]}{'...' if len(entry_data['title']) > 100 else ''}"
+            entry_data["summary"] = _fallback_summary(title)
             click.echo(f"  → Using fallback summary")
 
-        entry_data["_jina_failed"] = jina_failed
-        entry_data["_llm_failed"] = llm_failed
-        return entry_data
+    entry_data["_llm_failed"] = llm_failed
+    return entry_data
+
+
+async def process_entry(
+    entry: Dict,
+    client: Optional[httpx.AsyncClient] = None,
+    cache_db: Optional[Database] = None,
+    entry_date: Optional[datetime] = None,
+    imported_on: Optional[str] = None,
+) -> Optional[Dict]:
+    """Process an entry from the RSS feed to extract necessary data.
+
+    Returns a dict with entry data. Internal flags ``_jina_failed`` and
+    ``_llm_failed`` track failures so the caller can abort on high error rates.
+    ``client`` is the shared HTTP client for Jina reader requests, and ``cache_db`` the
+    database holding the Jina and summary caches. ``entry_date`` is the already-parsed
+    publication date, if the caller has it, and ``imported_on`` the run's import timestamp
+    (defaults to now).
+    """
+    entry_data = await _prepare_entry(entry, client, cache_db, entry_date, imported_on)
+    if entry_data is None:
+        return None
+    try:
+        return await _summarise_entry(entry_data, cache_db)
     except Exception as e:
         click.echo(f"Error processing entry '{entry.get('title', 'Unknown')}': {e}", err=True)
         return None
 
 
-def _get_existing_data(existing_table: Optional[Table]) -> tuple[set, Optional[datetime]]:
-    """Extract existing IDs and last article date from table.
+def _get_existing_data(
+    existing_table: Optional[Table],
+) -> tuple[set, set, Optional[datetime]]:
+    """Extract existing IDs, existing source links and last article date from table.
 
     Uses MAX(date) from actual article data rather than the zeeker build timestamp.
     This avoids the build-time vs article-time mismatch: zeeker sets last_updated to
@@ -230,25 +524,42 @@ def _get_existing_data(existing_table: Optional[Table]) -> tuple[set, Optional[d
     midnight-published articles on subsequent same-day builds.
     """
     existing_ids = set()
+    existing_links = set()
     last_article_date = None
 
     if not existing_table:
-        return existing_ids, last_article_date
+        return existing_ids, existing_links, last_article_date
 
-    existing_ids = {row["id"] for row in existing_table.rows}
+    # Read just the id and link columns rather than building a dict of every row, text and
+    # all. Links are kept so entries can be matched before their date is parsed.
+    for row_id, source_link in existing_table.db.execute(
+        f"SELECT id, source_link FROM [{existing_table.name}]"
+    ):
+        existing_ids.add(row_id)
+        if source_link:
+            existing_links.add(source_link)
 
     # Use the most recent article date from actual data, not the build timestamp
     try:
-        row = next(existing_table.db.execute(
-            f"SELECT MAX(date) as max_date FROM [{existing_table.name}]"
-        ))
+        row = next(
+            existing_table.db.execute(f"SELECT MAX(date) as max_date FROM [{existing_table.name}]")
+        )
         if row and row[0]:
             last_article_date = datetime.fromisoformat(row[0])
             click.echo(f"  → Last article date in DB: {last_article_date.isoformat()}")
     except Exception as e:
         click.echo(f"Could not get max article date from table: {e}", err=True)
 
-    return existing_ids, last_article_date
+    return existing_ids, existing_links, last_article_date
+
+
+# Title prefixes marking advertisements - various formats (including fullwidth colon U+FF1A)
+_ADV_PREFIXES = ("ADV:", "ADV\uff1a", "ADV ")
+
+
+def _is_advertisement(title: str) -> bool:
+    """Check whether a feed title marks an advertisement rather than a headline."""
+    return title.startswith(_ADV_PREFIXES)
 
 
 def _should_skip_entry(
@@ -257,32 +568,41 @@ def _should_skip_entry(
     last_updated: Optional[datetime],
     existing_ids: set,
     max_day_limit: int = 60,
-) -> tuple[bool, str]:
-    """Check if entry should be skipped and return skip reason."""
+    existing_links: Optional[set] = None,
+) -> tuple[bool, str, Optional[datetime]]:
+    """Check if entry should be skipped and return skip reason.
+
+    Also returns the parsed publication date (None if it was not parsed), so callers
+    don't parse it again.
+    """
     title = entry.get("title", "")
 
-    # Skip advertisements - various formats (including fullwidth colon U+FF1A)
-    if title.startswith("ADV:") or title.startswith("ADV\uff1a") or title.startswith("ADV "):
-        return True, "advertisement"
+    if _is_advertisement(title):
+        return True, "advertisement", None
+
+    # An article whose link is already stored is a duplicate; skip it without parsing the date
+    link = entry.get("link")
+    if link and existing_links and link in existing_links:
+        return True, "already_processed_by_link", None
 
     try:
-        entry_date = datetime.fromisoformat(convert_date_to_iso(entry.get("published", "")))
+        entry_date = parse_headline_date(entry.get("published", ""))
     except ValueError:
         click.echo(f"Error parsing date for entry: {title}", err=True)
-        return True, "date_error"
+        return True, "date_error", None
 
     days_old = (current_date - entry_date).days
     if days_old > max_day_limit:
-        return True, "too_old"
+        return True, "too_old", entry_date
 
     if last_updated and entry_date <= last_updated:
-        return True, "already_processed_by_time"
+        return True, "already_processed_by_time", entry_date
 
     entry_id = get_hash_id([entry_date.isoformat(), str(title)])
     if existing_ids and entry_id in existing_ids:
-        return True, "already_processed_by_id"
+        return True, "already_processed_by_id", entry_date
 
-    return False, ""
+    return False, "", entry_date
 
 
 def _log_skip_counts(
@@ -305,28 +625,44 @@ def _log_skip_counts(
         click.echo(f"Skipped {skipped_processed_id_count} headlines with duplicate IDs in database")
 
 
-async def _fetch_article_text(url: str) -> str:
-    """Fetch plain text from an article URL (HTTP fallback, no Jina required)."""
+async def _fetch_article_text(url: str, client: Optional[httpx.AsyncClient] = None) -> str:
+    """Fetch plain text from an article URL (HTTP fallback, no Jina required).
+
+    Backfill passes the ``client`` it shares across every article it fetches.
+    """
     try:
-        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-            r = await client.get(url, headers={"User-Agent": "ZeekerBot/1.0 (+https://data.zeeker.sg)"})
-            r.raise_for_status()
-            return r.text[:8000]
+        if client is not None:
+            r = await client.get(url)
+        else:
+            async with _new_article_client() as own_client:
+                r = await own_client.get(url)
+        r.raise_for_status()
+        return r.text[:8000]
     except Exception as e:
         click.echo(f"  → HTTP fetch failed for {url}: {e}", err=True)
         return ""
 
 
-async def _backfill_empty_summaries(existing_table: Optional[Table]) -> None:
-    """Retroactively generate summaries for rows that have empty or null summaries."""
+async def _backfill_empty_summaries(
+    existing_table: Optional[Table],
+    llm_semaphore: Optional[asyncio.Semaphore] = None,
+    cache_db: Optional[Database] = None,
+) -> None:
+    """Retroactively generate summaries for rows that have empty or null summaries.
+
+    ``llm_semaphore`` caps the LLM calls, which are otherwise all started at once, and
+    ``cache_db`` holds the Jina and summary caches.
+    """
     if not existing_table:
         return
 
     try:
-        rows = list(existing_table.db.execute(
-            f"SELECT id, title, source_link FROM [{existing_table.name}] "
-            "WHERE summary IS NULL OR summary = '' OR summary = 'None'"
-        ))
+        rows = list(
+            existing_table.db.execute(
+                f"SELECT id, title, source_link FROM [{existing_table.name}] "
+                "WHERE summary IS NULL OR summary = '' OR summary = 'None'"
+            )
+        )
     except Exception as e:
         click.echo(f"Backfill: could not query empty summaries: {e}", err=True)
         return
@@ -336,27 +672,96 @@ async def _backfill_empty_summaries(existing_table: Optional[Table]) -> None:
         return
 
     click.echo(f"Backfill: found {len(rows)} articles with empty summaries — regenerating")
-
-    async def _fix_one(row_id: str, title: str, source_link: str) -> None:
-        text = await _fetch_article_text(source_link)
+    db = existing_table.db
+
+    async def _fix_one(
+        client: httpx.AsyncClient, row_id: str, title: str, source_link: str
+    ) -> None:
+        # Prefer the cleaned-up Jina text from an earlier run over re-fetching raw HTML
+        cached = _get_cached_jina_content(cache_db, source_link) if cache_db is not None else None
+        text = cached or await _fetch_article_text(source_link, client)
         if not text:
             text = f"Article: {title}\nSource: {source_link}\n\nContent could not be retrieved."
         try:
-            async with _get_llm_semaphore():
-                summary = await get_summary(text)
-            existing_table.db.execute(
-                f"UPDATE [{existing_table.name}] SET summary = ? WHERE id = ?",
-                [summary, row_id]
+            # get_summary takes the LLM semaphore itself; holding it here too would
+            # deadlock once every permit is held by a caller waiting on the inner acquire
+            summary = await get_summary(text, cache_db, llm_semaphore)
+            db.execute(
+                f"UPDATE [{existing_table.name}] SET summary = ? WHERE id = ?", [summary, row_id]
             )
             click.echo(f"  → Backfilled summary for: {title[:60]}")
         except Exception as e:
             click.echo(f"  → Backfill failed for {title[:60]}: {e}", err=True)
 
-    tasks = [asyncio.create_task(_fix_one(r[0], r[1], r[2])) for r in rows]
-    await asyncio.gather(*tasks)
+    async with _new_article_client() as client:
+        tasks = [asyncio.create_task(_fix_one(client, r[0], r[1], r[2])) for r in rows]
+        await asyncio.gather(*tasks)
     click.echo(f"Backfill: done ({len(rows)} articles processed)")
 
 
+async def _process_entries(
+    entries: list[tuple[Dict, datetime]],
+    cache_db: Optional[Database] = None,
+    imported_on: Optional[str] = None,
+    llm_semaphore: Optional[asyncio.Semaphore] = None,
+) -> list[Optional[Dict]]:
+    """Process (entry, publication date) pairs through a two-stage worker pipeline.
+
+    HEADLINES_CONCURRENCY workers fetch article text from Jina and hand each prepared
+    entry to LLM_CONCURRENCY summary workers over a bounded queue, so Jina fetches for
+    later entries carry on while earlier ones are being summarised. Results keep the
+    order of ``entries``. ``llm_semaphore`` is shared with the caller's other LLM work;
+    the Jina semaphore is created here, per run (see http_helpers).
+    """
+    jina_semaphore = asyncio.Semaphore(HEADLINES_CONCURRENCY)
+    results: list[Optional[Dict]] = [None] * len(entries)
+    fetch_queue: asyncio.Queue = asyncio.Queue(maxsize=HEADLINES_CONCURRENCY)
+    summary_queue: asyncio.Queue = asyncio.Queue(maxsize=HEADLINES_CONCURRENCY)
+
+    async def fetch_worker(client: httpx.AsyncClient) -> None:
+        while True:
+            index, (entry, entry_date) = await fetch_queue.get()
+            try:
+                entry_data = await _prepare_entry(
+                    entry, client, cache_db, entry_date, imported_on, jina_semaphore
+                )
+                if entry_data is not None:
+                    await summary_queue.put((index, entry_data))
+            except Exception as e:
+                title = entry.get("title", "Unknown")
+                click.echo(f"Error processing entry '{title}': {e}", err=True)
+            finally:
+                fetch_queue.task_done()
+
+    async def summary_worker() -> None:
+        while True:
+            index, entry_data = await summary_queue.get()
+            try:
+                results[index] = await _summarise_entry(entry_data, cache_db, llm_semaphore)
+            except Exception as e:
+                title = entry_data.get("title", "Unknown")
+                click.echo(f"Error processing entry '{title}': {e}", err=True)
+            finally:
+                summary_queue.task_done()
+
+    # One client for every Jina request, so entries share keep-alive connections
+    # instead of each paying for a new TCP/TLS handshake
+    async with _new_jina_client() as client:
+        workers = [asyncio.create_task(fetch_worker(client)) for _ in range(HEADLINES_CONCURRENCY)]
+        workers += [asyncio.create_task(summary_worker()) for _ in range(LLM_CONCURRENCY)]
+        for item in enumerate(entries):
+            await fetch_queue.put(item)
+        # Every hand-off happens before its fetch is marked done, so once the fetch
+        # queue drains the summary queue holds all remaining work
+        await fetch_queue.join()
+        await summary_queue.join()
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    return results
+
+
 async def fetch_data(existing_table: Optional[Table]):
     """
     Fetch data for the headlines table.
@@ -369,54 +774,94 @@ async def fetch_data(existing_table: Optional[Table]):
         List[Dict[str, Any]]: List of records to insert into database
 
     """
-    await _backfill_empty_summaries(existing_table)
+    # Created per run, like the HTTP clients (see http_helpers)
+    llm_semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+    if existing_table:
+        _drop_published_cache_tables(existing_table.db)
+    cache_db = _open_cache_db()
+    await _backfill_empty_summaries(existing_table, llm_semaphore, cache_db)
     click.echo(f"Fetching headlines from {HEADLINES_URL}")
-    feed = feedparser.parse(HEADLINES_URL)
+    # The validators only describe what is stored while the table exists; a new or rebuilt
+    # table must be sent the whole feed
+    use_validators = cache_db is not None and existing_table is not None
+    etag, modified = (
+        _get_feed_validators(cache_db, HEADLINES_URL) if use_validators else (None, None)
+    )
+    # feedparser fetches and parses synchronously; run it in a thread so the blocking
+    # download doesn't stall the event loop. Its HTML sanitising and relative-URI passes are
+    # skipped: only plain title/link/date fields are used, and article text comes from Jina.
+    feed = await asyncio.to_thread(
+        feedparser.parse,
+        HEADLINES_URL,
+        etag=etag,
+        modified=modified,
+        sanitize_html=False,
+        resolve_relative_uris=False,
+    )
+    if feed.get("status") == 304:
+        click.echo("Headlines feed not modified since the last run — nothing to fetch")
+        return []
     max_day_limit = 60
     current_date = datetime.now()
 
-    existing_ids, last_updated = _get_existing_data(existing_table)
-
-    tasks = []
+    entries_to_process = []
     new_entries_count = 0
     skipped_adv_count = 0
     skipped_old_count = 0
     skipped_processed_time_count = 0
     skipped_processed_id_count = 0
 
+    # Drop advertisements first: they need no date parsing or database lookups
+    candidates = []
     for entry in feed.entries:
-        should_skip, skip_reason = _should_skip_entry(
-            entry, current_date, last_updated, existing_ids, max_day_limit
+        title = entry.get("title", "")
+        if _is_advertisement(title):
+            skipped_adv_count += 1
+            click.echo(f"Skipping advertisement: {title}")
+        else:
+            candidates.append(entry)
+
+    # Only scan the existing table if there is something left to check against it
+    if candidates:
+        existing_ids, existing_links, last_updated = _get_existing_data(existing_table)
+    else:
+        existing_ids, existing_links, last_updated = set(), set(), None
+
+    # Formatted once for the "before last_updated" skip messages
+    last_updated_str = last_updated.strftime("%Y-%m-%d %H:%M:%S") if last_updated else "None"
+
+    for entry in candidates:
+        should_skip, skip_reason, entry_date = _should_skip_entry(
+            entry, current_date, last_updated, existing_ids, max_day_limit, existing_links
         )
 
         if should_skip:
             title = entry.get("title", "")
-            if skip_reason == "advertisement":
-                skipped_adv_count += 1
-                click.echo(f"Skipping advertisement: {title}")
-            elif skip_reason == "too_old":
+            if skip_reason == "too_old":
                 skipped_old_count += 1
-                days_old = (
-                    current_date
-                    - datetime.fromisoformat(convert_date_to_iso(entry.get("published", "")))
-                ).days
+                days_old = (current_date - entry_date).days
                 click.echo(f"Skipping old headline ({days_old} days): {title}")
             elif skip_reason == "already_processed_by_time":
                 skipped_processed_time_count += 1
                 entry_date_str = entry.get("published", "")
                 click.echo(
-                    f"  → Skipping (published {entry_date_str}, before last_updated {last_updated.strftime('%Y-%m-%d %H:%M:%S') if last_updated else 'None'}): {title}"
+                    f"  → Skipping (published {entry_date_str}, before last_updated {last_updated_str}): {title}"
                 )
             elif skip_reason == "already_processed_by_id":
                 skipped_processed_id_count += 1
                 click.echo(f"  → Skipping (duplicate ID in database): {title}")
+            elif skip_reason == "already_processed_by_link":
+                skipped_processed_id_count += 1
+                click.echo(f"  → Skipping (duplicate link in database): {title}")
             continue
 
         new_entries_count += 1
-        task = asyncio.create_task(process_entry(entry))
-        tasks.append(task)
+        entries_to_process.append((entry, entry_date))
 
-    results = await asyncio.gather(*tasks)
+    # Every headline imported in this run shares one import timestamp
+    results = await _process_entries(
+        entries_to_process, cache_db, current_date.isoformat(), llm_semaphore
+    )
 
     # Check failure rates — if most entries failed, something is wrong
     # (e.g. expired API token, service outage)
@@ -460,6 +905,15 @@ async def fetch_data(existing_table: Optional[Table]):
         skipped_processed_id_count,
         max_day_limit,
     )
-    return results
-
-
+    # Remember the feed's validators only once every entry went through, so a 304 on the
+    # next run can never hide an entry that failed this time
+    if (
+        cache_db is not None
+        and feed.get("status") == 200
+        and len(valid_results) == len(entries_to_process)
+    ):
+        _save_feed_validators(cache_db, HEADLINES_URL, feed.get("etag"), feed.get("modified"))
+
+    # Zeeker inserts the returned rows itself and rejects non-dict items, so hand back only
+    # the entries that were processed
+    return valid_results
@@ -0,0 +1,48 @@
+"""
+HTTP helpers shared by the resources.
+
+Zeeker runs each async fetch function in its own event loop. Anything that binds to a
+loop (HTTP clients, semaphores, rate limiters) is therefore created per run, never at import
+time, where it would stay bound to the first run's loop. Clients are built with new_client.
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+USER_AGENT = "ZeekerBot/1.0 (+https://data.zeeker.sg)"
+# Longest Retry-After we will honour before retrying a request
+MAX_RETRY_AFTER = 60.0
+
+
+def new_client(
+    timeout: float, client_class: type = httpx.AsyncClient, **options
+) -> httpx.AsyncClient:
+    """Build an HTTP/2 keep-alive client that identifies itself as ZeekerBot.
+
+    ``client_class`` lets callers swap in a compatible client such as hishel's caching one;
+    ``options`` are passed through to it.
+    """
+    options.setdefault("headers", {"User-Agent": USER_AGENT})
+    return client_class(http2=True, timeout=timeout, **options)
+
+
+def retry_after_seconds(
+    response: httpx.Response, default: Optional[float] = None
+) -> Optional[float]:
+    """Seconds a response's Retry-After header asks us to wait, capped at MAX_RETRY_AFTER.
+
+    The header may give either a number of seconds or an HTTP date. Returns ``default``
+    when it is missing or can't be parsed.
+    """
+    value = response.headers.get("Retry-After", "")
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return default
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
@@ -1,25 +1,42 @@
 """
-Tests for about_singapore_law fragment creation logic.
+Tests for the about_singapore_law resource: fetching, parsing and fragment creation.
 """
 
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
 import pytest
+import respx
+from lxml import etree
 
-from resources.about_singapore_law import create_content_fragments
+from chapter_parser import ContentPart, group_pseudo_list_items, parse_chapter_content
+from resources import about_singapore_law
+from resources.about_singapore_law import (
+    _get,
+    _RateLimiter,
+    _start_parse_pool,
+    create_content_fragments,
+    discover_chapter_links,
+    parse_chapter_links,
+)
 
 
 def test_simple_numbered_paragraphs():
     """Test basic numbered paragraphs create separate fragments."""
     content_parts = [
-        {
-            "text": "1.1.1      This is the first numbered paragraph with some content.",
-            "type": "paragraph",
-            "original_text": "1.1.1      This is the first numbered paragraph with some content.",
-        },
-        {
-            "text": "1.1.2      This is the second numbered paragraph with different content.",
-            "type": "paragraph",
-            "original_text": "1.1.2      This is the second numbered paragraph with different content.",
-        },
+        ContentPart(
+            text="1.1.1      This is the first numbered paragraph with some content.",
+            type="paragraph",
+            original_text="1.1.1      This is the first numbered paragraph with some content.",
+        ),
+        ContentPart(
+            text="1.1.2      This is the second numbered paragraph with different content.",
+            type="paragraph",
+            original_text="1.1.2      This is the second numbered paragraph with different content.",
+        ),
     ]
 
     fragments = create_content_fragments(content_parts, "test_chapter")
@@ -35,22 +52,22 @@ def test_simple_numbered_paragraphs():
 def test_header_attached_to_next_numbered_paragraph():
     """Test that headers are attached to the following numbered paragraph."""
     content_parts = [
-        {
-            "text": "SECTION 1 INTRODUCTION",
-            "type": "heading",
-            "original_text": "SECTION 1 INTRODUCTION",
-        },
-        {
-            "text": "1.1.1      The Singapore legal system is a rich tapestry of laws.",
-            "type": "paragraph",
-            "original_text": "1.1.1      The Singapore legal system is a rich tapestry of laws.",
-        },
-        {"text": "SECTION 2 HISTORY", "type": "heading", "original_text": "SECTION 2 HISTORY"},
-        {
-            "text": "1.2.1      From its founding by Sir Thomas Stamford Raffles.",
-            "type": "paragraph",
-            "original_text": "1.2.1      From its founding by Sir Thomas Stamford Raffles.",
-        },
+        ContentPart(
+            text="SECTION 1 INTRODUCTION",
+            type="heading",
+            original_text="SECTION 1 INTRODUCTION",
+        ),
+        ContentPart(
+            text="1.1.1      The Singapore legal system is a rich tapestry of laws.",
+            type="paragraph",
+            original_text="1.1.1      The Singapore legal system is a rich tapestry of laws.",
+        ),
+        ContentPart(text="SECTION 2 HISTORY", type="heading", original_text="SECTION 2 HISTORY"),
+        ContentPart(
+            text="1.2.1      From its founding by Sir Thomas Stamford Raffles.",
+            type="paragraph",
+            original_text="1.2.1      From its founding by Sir Thomas Stamford Raffles.",
+        ),
     ]
 
     fragments = create_content_fragments(content_parts, "test_chapter")
@@ -71,22 +88,22 @@ def test_header_attached_to_next_numbered_paragraph():
 def test_multiple_headers_before_numbered_paragraph():
     """Test multiple headers are all attached to the next numbered paragraph."""
     content_parts = [
-        {
-            "text": "SECTION 1 INTRODUCTION",
-            "type": "heading",
-            "original_text": "SECTION 1 INTRODUCTION",
-        },
-        {
-            "text": "Overview of Legal System",
-            "type": "heading",
-            "original_text": "Overview of Legal System",
-        },
-        {"text": "Historical Context", "type": "heading", "original_text": "Historical Context"},
-        {
-            "text": "1.1.1      The Singapore legal system is comprehensive.",
-            "type": "paragraph",
-            "original_text": "1.1.1      The Singapore legal system is comprehensive.",
-        },
+        ContentPart(
+            text="SECTION 1 INTRODUCTION",
+            type="heading",
+            original_text="SECTION 1 INTRODUCTION",
+        ),
+        ContentPart(
+            text="Overview of Legal System",
+            type="heading",
+            original_text="Overview of Legal System",
+        ),
+        ContentPart(text="Historical Context", type="heading", original_text="Historical Context"),
+        ContentPart(
+            text="1.1.1      The Singapore legal system is comprehensive.",
+            type="paragraph",
+            original_text="1.1.1      The Singapore legal system is comprehensive.",
+        ),
     ]
 
     fragments = create_content_fragments(content_parts, "test_chapter")
@@ -102,26 +119,28 @@ def test_multiple_headers_before_numbered_paragraph():
 def test_indented_paragraphs_attach_to_previous_fragment():
     """Test that indented paragraphs attach to the previous numbered paragraph."""
     content_parts = [
-        {
-            "text": "1.1.1      This is a numbered paragraph with some legal content.",
-            "type": "paragraph",
-            "original_text": "1.1.1      This is a numbered paragraph with some legal content.",
-        },
-        {
-            "text": "    This is an indented continuation paragraph that explains more.",
-            "type": "paragraph",
-            "original_text": "<p>    This is an indented continuation paragraph that explains more.</p>",
-        },
-        {
-            "text": "    This is another indented paragraph with additional details.",
-            "type": "paragraph",
-            "original_text": "<p>    This is another indented paragraph with additional details.</p>",
-        },
-        {
-            "text": "1.1.2      This is the next numbered paragraph.",
-            "type": "paragraph",
-            "original_text": "1.1.2      This is the next numbered paragraph.",
-        },
+        ContentPart(
+            text="1.1.1      This is a numbered paragraph with some legal content.",
+            type="paragraph",
+            original_text="1.1.1      This is a numbered paragraph with some legal content.",
+        ),
+        ContentPart(
+            text="    This is an indented continuation paragraph that explains more.",
+            type="paragraph",
+            original_text="<p>    This is an indented continuation paragraph that explains more.</p>",
+            is_indented=True,
+        ),
+        ContentPart(
+            text="    This is another indented paragraph with additional details.",
+            type="paragraph",
+            original_text="<p>    This is another indented paragraph with additional details.</p>",
+            is_indented=True,
+        ),
+        ContentPart(
+            text="1.1.2      This is the next numbered paragraph.",
+            type="paragraph",
+            original_text="1.1.2      This is the next numbered paragraph.",
+        ),
     ]
 
     fragments = create_content_fragments(content_parts, "test_chapter")
@@ -142,33 +161,35 @@ def test_indented_paragraphs_attach_to_previous_fragment():
 def test_headers_and_indented_paragraphs_combined():
     """Test complex scenario with headers before and indented content after."""
     content_parts = [
-        {
-            "text": "SECTION 1 INTRODUCTION",
-            "type": "heading",
-            "original_text": "SECTION 1 INTRODUCTION",
-        },
-        {"text": "Legal Framework", "type": "heading", "original_text": "Legal Framework"},
-        {
-            "text": "1.1.1      The Singapore legal system operates under specific principles.",
-            "type": "paragraph",
-            "original_text": "1.1.1      The Singapore legal system operates under specific principles.",
-        },
-        {
-            "text": "    These principles include fairness and justice.",
-            "type": "paragraph",
-            "original_text": "<p>    These principles include fairness and justice.</p>",
-        },
-        {
-            "text": "    The system also emphasizes efficiency.",
-            "type": "paragraph",
-            "original_text": "<p>    The system also emphasizes efficiency.</p>",
-        },
-        {"text": "SECTION 2 HISTORY", "type": "heading", "original_text": "SECTION 2 HISTORY"},
-        {
-            "text": "1.2.1      Singapore's legal development has been extensive.",
-            "type": "paragraph",
-            "original_text": "1.2.1      Singapore's legal development has been extensive.",
-        },
+        ContentPart(
+            text="SECTION 1 INTRODUCTION",
+            type="heading",
+            original_text="SECTION 1 INTRODUCTION",
+        ),
+        ContentPart(text="Legal Framework", type="heading", original_text="Legal Framework"),
+        ContentPart(
+            text="1.1.1      The Singapore legal system operates under specific principles.",
+            type="paragraph",
+            original_text="1.1.1      The Singapore legal system operates under specific principles.",
+        ),
+        ContentPart(
+            text="    These principles include fairness and justice.",
+            type="paragraph",
+            original_text="<p>    These principles include fairness and justice.</p>",
+            is_indented=True,
+        ),
+        ContentPart(
+            text="    The system also emphasizes efficiency.",
+            type="paragraph",
+            original_text="<p>    The system also emphasizes efficiency.</p>",
+            is_indented=True,
+        ),
+        ContentPart(text="SECTION 2 HISTORY", type="heading", original_text="SECTION 2 HISTORY"),
+        ContentPart(
+            text="1.2.1      Singapore's legal development has been extensive.",
+            type="paragraph",
+            original_text="1.2.1      Singapore's legal development has been extensive.",
+        ),
     ]
 
     fragments = create_content_fragments(content_parts, "test_chapter")
@@ -192,17 +213,17 @@ def test_headers_and_indented_paragraphs_combined():
 def test_remaining_headers_attach_to_last_fragment():
     """Test that headers at the end attach to the last fragment."""
     content_parts = [
-        {
-            "text": "1.1.1      This is the only numbered paragraph.",
-            "type": "paragraph",
-            "original_text": "1.1.1      This is the only numbered paragraph.",
-        },
-        {"text": "Final Notes", "type": "heading", "original_text": "Final Notes"},
-        {
-            "text": "Additional Information",
-            "type": "heading",
-            "original_text": "Additional Information",
-        },
+        ContentPart(
+            text="1.1.1      This is the only numbered paragraph.",
+            type="paragraph",
+            original_text="1.1.1      This is the only numbered paragraph.",
+        ),
+        ContentPart(text="Final Notes", type="heading", original_text="Final Notes"),
+        ContentPart(
+            text="Additional Information",
+            type="heading",
+            original_text="Additional Information",
+        ),
     ]
 
     fragments = create_content_fragments(content_parts, "test_chapter")
@@ -217,22 +238,22 @@ def test_remaining_headers_attach_to_last_fragment():
 def test_skip_short_paragraphs():
     """Test that very short paragraphs are skipped."""
     content_parts = [
-        {
-            "text": "Hi",
-            "type": "paragraph",
-            "original_text": "Hi",
-        },  # Too short (< 5 chars), should be skipped
-        {
-            "text": "1.1.1      This is a proper numbered paragraph with sufficient content.",
-            "type": "paragraph",
-            "original_text": "1.1.1      This is a proper numbered paragraph with sufficient content.",
-        },
-        {"text": "x", "type": "paragraph", "original_text": "x"},  # Too short, should be skipped
-        {
-            "text": "1.1.2      This is another proper numbered paragraph.",
-            "type": "paragraph",
-            "original_text": "1.1.2      This is another proper numbered paragraph.",
-        },
+        ContentPart(
+            text="Hi",
+            type="paragraph",
+            original_text="Hi",
+        ),  # Too short (< 5 chars), should be skipped
+        ContentPart(
+            text="1.1.1      This is a proper numbered paragraph with sufficient content.",
+            type="paragraph",
+            original_text="1.1.1      This is a proper numbered paragraph with sufficient content.",
+        ),
+        ContentPart(text="x", type="paragraph", original_text="x"),  # Too short, should be skipped
+        ContentPart(
+            text="1.1.2      This is another proper numbered paragraph.",
+            type="paragraph",
+            original_text="1.1.2      This is another proper numbered paragraph.",
+        ),
     ]
 
     fragments = create_content_fragments(content_parts, "test_chapter")
@@ -251,17 +272,19 @@ def test_empty_paragraphs_list():
 def test_no_numbered_paragraphs():
     """Test handling when there are only headers and no numbered paragraphs."""
     content_parts = [
-        {
-            "text": "SECTION 1 INTRODUCTION",
-            "type": "heading",
-            "original_text": "SECTION 1 INTRODUCTION",
-        },
-        {
-            "text": "This is just a header section",
-            "type": "heading",
-            "original_text": "This is just a header section",
-        },
-        {"text": "More header content", "type": "heading", "original_text": "More header content"},
+        ContentPart(
+            text="SECTION 1 INTRODUCTION",
+            type="heading",
+            original_text="SECTION 1 INTRODUCTION",
+        ),
+        ContentPart(
+            text="This is just a header section",
+            type="heading",
+            original_text="This is just a header section",
+        ),
+        ContentPart(
+            text="More header content", type="heading", original_text="More header content"
+        ),
     ]
 
     fragments = create_content_fragments(content_parts, "test_chapter")
@@ -271,22 +294,23 @@ def test_no_numbered_paragraphs():
 def test_fragment_order_and_char_count():
     """Test that fragments have correct order and character counts."""
     content_parts = [
-        {"text": "Header One", "type": "heading", "original_text": "Header One"},
-        {
-            "text": "1.1.1      First numbered paragraph.",
-            "type": "paragraph",
-            "original_text": "1.1.1      First numbered paragraph.",
-        },
-        {
-            "text": "    Indented content for first.",
-            "type": "paragraph",
-            "original_text": "<p>    Indented content for first.</p>",
-        },
-        {
-            "text": "1.1.2      Second numbered paragraph.",
-            "type": "paragraph",
-            "original_text": "1.1.2      Second numbered paragraph.",
-        },
+        ContentPart(text="Header One", type="heading", original_text="Header One"),
+        ContentPart(
+            text="1.1.1      First numbered paragraph.",
+            type="paragraph",
+            original_text="1.1.1      First numbered paragraph.",
+        ),
+        ContentPart(
+            text="    Indented content for first.",
+            type="paragraph",
+            original_text="<p>    Indented content for first.</p>",
+            is_indented=True,
+        ),
+        ContentPart(
+            text="1.1.2      Second numbered paragraph.",
+            type="paragraph",
+            original_text="1.1.2      Second numbered paragraph.",
+        ),
     ]
 
     fragments = create_content_fragments(content_parts, "test_chapter")
@@ -308,21 +332,21 @@ def test_fragment_order_and_char_count():
 def test_various_numbering_patterns():
     """Test different numbering patterns work correctly."""
     content_parts = [
-        {
-            "text": "1.1.1      First pattern.",
-            "type": "paragraph",
-            "original_text": "1.1.1      First pattern.",
-        },
-        {
-            "text": "1.2.15     Second pattern with larger numbers.",
-            "type": "paragraph",
-            "original_text": "1.2.15     Second pattern with larger numbers.",
-        },
-        {
-            "text": "2.10.3     Third pattern with different section.",
-            "type": "paragraph",
-            "original_text": "2.10.3     Third pattern with different section.",
-        },
+        ContentPart(
+            text="1.1.1      First pattern.",
+            type="paragraph",
+            original_text="1.1.1      First pattern.",
+        ),
+        ContentPart(
+            text="1.2.15     Second pattern with larger numbers.",
+            type="paragraph",
+            original_text="1.2.15     Second pattern with larger numbers.",
+        ),
+        ContentPart(
+            text="2.10.3     Third pattern with different section.",
+            type="paragraph",
+            original_text="2.10.3     Third pattern with different section.",
+        ),
     ]
 
     fragments = create_content_fragments(content_parts, "test_chapter")
@@ -335,34 +359,15 @@ def test_various_numbering_patterns():
 
 def test_indented_content_only_with_exact_spacing():
     """Test that only paragraphs with exactly 4 spaces are treated as indented."""
-    content_parts = [
-        {
-            "text": "1.1.1      Main numbered paragraph.",
-            "type": "paragraph",
-            "original_text": "1.1.1      Main numbered paragraph.",
-        },
-        {
-            "text": "    Four spaces - should be indented content.",
-            "type": "paragraph",
-            "original_text": "<p>    Four spaces - should be indented content.</p>",
-        },
-        {
-            "text": "  Two spaces - should be header for next.",
-            "type": "paragraph",
-            "original_text": "  Two spaces - should be header for next.",
-        },
-        {
-            "text": "        Eight spaces - should be header for next.",
-            "type": "paragraph",
-            "original_text": "        Eight spaces - should be header for next.",
-        },
-        {
-            "text": "1.1.2      Next numbered paragraph.",
-            "type": "paragraph",
-            "original_text": "1.1.2      Next numbered paragraph.",
-        },
-    ]
-
+    html = b"""<html><body><div class="edn_article">
+        <p>1.1.1      Main numbered paragraph.</p>
+        <p>    Four spaces - should be indented content.</p>
+        <p>  Two spaces - should be header for next.</p>
+        <p>        Eight spaces - should be header for next.</p>
+        <p>1.1.2      Next numbered paragraph.</p>
+    </div></body></html>"""
+
+    content_parts = parse_chapter_content(html)
     fragments = create_content_fragments(content_parts, "test_chapter")
 
     assert len(fragments) == 2
@@ -379,5 +384,345 @@ def test_indented_content_only_with_exact_spacing():
     assert "Next numbered paragraph" in second_content
 
 
+def test_styled_paragraphs_are_indented():
+    """Test that a left margin or padding marks a paragraph as indented."""
+    html = b"""<html><body><div class="edn_article">
+        <p>1.1.1      Main numbered paragraph.</p>
+        <p style="margin-left: 40px">Indented with a margin.</p>
+        <p style="padding-left: 2em">Indented with padding.</p>
+        <p style="text-align: center">Centred, not indented.</p>
+    </div></body></html>"""
+
+    content_parts = parse_chapter_content(html)
+
+    assert [part.is_indented for part in content_parts] == [False, True, True, False]
+
+
+# A chapter page exercising the markup the old BeautifulSoup parser was checked against:
+# nested divs, tables and lists, comments and scripts, and a footer
+CHAPTER_PAGE = b"""<html><head><script>var x = "<p>not content</p>";</script></head>
+<body>
+<div class="edn_mainWrapper"><a href="/About-Singapore-Law/Overview">Skip</a></div>
+<div class="edn_article">
+  <h2>Ch. 01 The Singapore Legal System</h2>
+  <!-- editor note: <p>hidden</p> -->
+  <div class="intro">
+    <div><p>1.1.1 The legal system is based on the <b>English</b> common law.</p></div>
+  </div>
+  <p style="margin-left: 40px">An indented note on the paragraph above.</p>
+  <table>
+    <tr><th>Court</th><th>Judges</th></tr>
+    <tr><td>Court of Appeal<table><tr><td>Nested</td></tr></table></td><td><p>5</p></td></tr>
+  </table>
+  <p>1.1.2 Statutes are enacted by Parliament.<script>track();</script></p>
+  <ul>
+    <li>Constitution<ul><li>Articles</li></ul></li>
+    <li><p>Acts of Parliament</p></li>
+  </ul>
+  <ol><li>First</li><li>Second</li></ol>
+  <p>Updated as at 1 January 2025</p>
+  <p>1.1.3 This paragraph follows the footer.</p>
+</div>
+</body></html>"""
+
+# The parts the BeautifulSoup implementation produced for CHAPTER_PAGE
+CHAPTER_PAGE_PARTS = [
+    ("Ch. 01 The Singapore Legal System", "heading", False),
+    # Each enclosing div yields the paragraph again, as every matching element did before
+    ("1.1.1 The legal system is based on theEnglishcommon law.", "paragraph", False),
+    ("1.1.1 The legal system is based on theEnglishcommon law.", "paragraph", False),
+    ("1.1.1 The legal system is based on theEnglishcommon law.", "paragraph", False),
+    ("An indented note on the paragraph above.", "paragraph", True),
+    # Nested tables are flattened into the outer table's rows; their cells are not repeated
+    # as separate parts
+    ("Court | Judges\nCourt of AppealNested | Nested | 5\nNested", "table", False),
+    ("1.1.2 Statutes are enacted by Parliament.", "paragraph", False),
+    ("- ConstitutionArticles\n- Acts of Parliament", "list", False),
+    ("• First\n• Second", "list", False),
+]
+
+
+def test_parse_chapter_content_matches_previous_parser():
+    """Test nested markup, comments, scripts and the footer cut-off against known output."""
+    content_parts = parse_chapter_content(CHAPTER_PAGE, "utf-8")
+
+    assert [(p.text, p.type, p.is_indented) for p in content_parts] == CHAPTER_PAGE_PARTS
+
+
+def test_parse_chapter_content_article_on_any_element():
+    """Test that .edn_article is found on elements the fast parse pass doesn't look at."""
+    page = CHAPTER_PAGE.replace(b'<div class="edn_article">', b'<form class="edn_article">')
+    page = page.replace(b"</div>\n</body>", b"</form>\n</body>")
+
+    content_parts = parse_chapter_content(page, "utf-8")
+
+    assert [(p.text, p.type, p.is_indented) for p in content_parts] == CHAPTER_PAGE_PARTS
+
+
+def test_parse_chapter_content_without_article_raises():
+    """Test that a page without an .edn_article element is rejected."""
+    with pytest.raises(ValueError, match="edn_article"):
+        parse_chapter_content(b"<html><body><p>1.1.1 No article here.</p></body></html>")
+
+
+def test_parse_chapter_links():
+    """Test that only meaningful chapter links in the first .edn_mainWrapper are kept."""
+    section_url = "https://www.singaporelawwatch.sg/About-Singapore-Law/Overview"
+    page = b"""<html><body>
+    <a href="https://www.singaporelawwatch.sg/About-Singapore-Law/Outside">Outside the wrapper</a>
+    <div class="page edn_mainWrapper"><ul>
+      <li><a href="https://www.singaporelawwatch.sg/About-Singapore-Law/Overview/ch-01"
+        >Ch. 01 <span>The Singapore Legal System</span></a></li>
+      <li><a href="https://www.singaporelawwatch.sg/About-Singapore-Law/Overview/ch-02">Ch. 2</a></li>
+      <li><a href="https://www.singaporelawwatch.sg/About-Singapore-Law/Overview">Overview</a></li>
+      <li><a href="https://www.example.com/elsewhere">External chapter link</a></li>
+      <li><a>Anchor without a link</a></li>
+    </ul></div>
+    <div class="edn_mainWrapper">
+      <a href="https://www.singaporelawwatch.sg/About-Singapore-Law/Second">Second wrapper</a>
+    </div>
+    </body></html>"""
+
+    chapters = parse_chapter_links(
+        etree.fromstring(page, etree.HTMLParser()), section_url, "Overview", "2025-01-01 00:00:00"
+    )
+
+    assert chapters == [
+        {
+            "id": "e6537eb984c5",
+            "item_url": "https://www.singaporelawwatch.sg/About-Singapore-Law/Overview/ch-01",
+            "title": "Ch. 01The Singapore Legal System",
+            "section": "Overview",
+            "home_page": "Overview",
+            "last_scraped": "2025-01-01 00:00:00",
+            "content_length": 0,
+        }
+    ]
+
+
+def test_consecutive_legal_list_paragraphs_are_grouped():
+    """Test that runs of "the power to ..." style paragraphs become one list."""
+    content_parts = [
+        ContentPart(
+            text="The President has a veto against the appointment of key officers.",
+            type="paragraph",
+            original_text="<p>The President has a veto against the appointment of key officers.</p>",
+        ),
+        ContentPart(
+            text="The power to withhold assent to supply bills.",
+            type="paragraph",
+            original_text="<p>The power to withhold assent to supply bills.</p>",
+        ),
+        ContentPart(
+            text="The power tools of the courts were limited in scope.",
+            type="paragraph",
+            original_text="<p>The power tools of the courts were limited in scope.</p>",
+        ),
+    ]
+
+    grouped = list(group_pseudo_list_items(content_parts))
+
+    assert [part.type for part in grouped] == ["list", "paragraph"]
+    assert grouped[0].text.count("• ") == 2
+    assert grouped[1] is content_parts[2]
+
+
+SECTION_URL = "https://www.singaporelawwatch.sg/About-Singapore-Law/Overview"
+
+
+def _record_starts(starts, responses):
+    """Build a respx side effect that notes when each request starts and answers in turn."""
+    responses = iter(responses)
+
+    def side_effect(request):
+        starts.append(asyncio.get_running_loop().time())
+        return next(responses)
+
+    return side_effect
+
+
+@respx.mock
+def test_rate_limiter_spaces_request_starts():
+    """Test that requests sharing a limiter start at least one interval apart."""
+    starts = []
+    responses = [httpx.Response(200) for _ in range(4)]
+    respx.get(SECTION_URL).mock(side_effect=_record_starts(starts, responses))
+
+    async def fetch_all():
+        limiter = _RateLimiter(rate=20)
+        async with httpx.AsyncClient() as client:
+            await asyncio.gather(*[_get(client, SECTION_URL, limiter) for _ in range(4)])
+
+    asyncio.run(fetch_all())
+
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert len(gaps) == 3
+    assert all(gap >= 0.045 for gap in gaps)
+
+
+@respx.mock
+def test_get_retries_after_429():
+    """Test that a 429 pauses the limiter for its Retry-After and the request is retried."""
+    starts = []
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0.2"}),
+        httpx.Response(200, text="ok"),
+    ]
+    route = respx.get(SECTION_URL).mock(side_effect=_record_starts(starts, responses))
+
+    async def fetch():
+        async with httpx.AsyncClient() as client:
+            return await _get(client, SECTION_URL, _RateLimiter(rate=100))
+
+    response = asyncio.run(fetch())
+
+    assert response.status_code == 200
+    assert response.text == "ok"
+    assert route.call_count == 2
+    assert starts[1] - starts[0] >= 0.19
+
+
+@respx.mock
+def test_discover_chapter_links_retries_after_429():
+    """Test that the streamed section fetch is retried after a 429."""
+    page = b"""<html><body><div class="edn_mainWrapper">
+      <a href="https://www.singaporelawwatch.sg/About-Singapore-Law/Overview/ch-01">Ch. 01 Legal</a>
+    </div></body></html>"""
+    route = respx.get(SECTION_URL).mock(
+        side_effect=[
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, content=page),
+        ]
+    )
+
+    async def discover():
+        async with httpx.AsyncClient() as client:
+            return await discover_chapter_links(client, SECTION_URL, "Overview")
+
+    chapters = asyncio.run(discover())
+
+    assert route.call_count == 2
+    assert [chapter["title"] for chapter in chapters] == ["Ch. 01 Legal"]
+
+
+@respx.mock
+def test_chapter_linked_from_two_sections_is_fetched_once(monkeypatch):
+    """Test that a chapter listed in two sections becomes one chapter with one set of fragments."""
+    chapter_url = "https://www.singaporelawwatch.sg/About-Singapore-Law/Overview/ch-01"
+    sections = [
+        ("https://www.singaporelawwatch.sg/About-Singapore-Law/Overview", "Overview"),
+        ("https://www.singaporelawwatch.sg/About-Singapore-Law/Commercial-Law", "Commercial Law"),
+    ]
+    section_page = f"""<html><body><div class="edn_mainWrapper">
+      <a href="{chapter_url}">Ch. 01 The Singapore Legal System</a>
+    </div></body></html>"""
+    for section_url, _ in sections:
+        respx.get(section_url).mock(return_value=httpx.Response(200, text=section_page))
+    chapter_page = b"""<html><body><div class="edn_article">
+      <p>1.1.1 The legal system is based on the English common law.</p>
+      <p>1.1.2 Statutes are enacted by Parliament.</p>
+    </div></body></html>"""
+    chapter_route = respx.get(chapter_url).mock(
+        return_value=httpx.Response(200, content=chapter_page)
+    )
+    # fetch_data only runs once per process; let this test's run through
+    monkeypatch.delenv(about_singapore_law._RAN_PID_KEY, raising=False)
+
+    async def fetch():
+        chapters = await about_singapore_law.fetch_data(None)
+        return chapters, await about_singapore_law.fetch_fragments_data(None, chapters)
+
+    with (
+        patch.object(about_singapore_law, "get_home_page_urls", return_value=sections),
+        patch.object(about_singapore_law, "HTTP_CACHE_PATH", ""),
+        patch.object(about_singapore_law, "_start_parse_pool", AsyncMock(return_value=None)),
+    ):
+        chapters, fragments = asyncio.run(fetch())
+
+    assert [(chapter["item_url"], chapter["section"]) for chapter in chapters] == [
+        (chapter_url, "Overview")
+    ]
+    assert chapter_route.call_count == 1
+    chapter_id = chapters[0]["id"]
+    assert [fragment["id"] for fragment in fragments] == [
+        f"{chapter_id}_1.1.1",
+        f"{chapter_id}_1.1.2",
+    ]
+
+
+@respx.mock
+def test_http_cache_revalidates_unchanged_page(tmp_path):
+    """Test that a later run revalidates a cached page and serves its body from a 304."""
+    chapter_url = "https://www.singaporelawwatch.sg/About-Singapore-Law/Overview/ch-01"
+    validators = []
+
+    def answer(request):
+        validators.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        headers = {"ETag": '"v1"', "Cache-Control": "private, no-cache"}
+        return httpx.Response(200, content=b"<p>Chapter</p>", headers=headers)
+
+    respx.get(chapter_url).mock(side_effect=answer)
+
+    async def fetch():
+        async with about_singapore_law._new_client() as client:
+            response = await _get(client, chapter_url)
+            return response.status_code, response.content
+
+    cache_path = str(tmp_path / "http_cache.db")
+    with patch.object(about_singapore_law, "HTTP_CACHE_PATH", cache_path):
+        # Each build runs its fetches in a fresh event loop with a fresh client
+        first = asyncio.run(fetch())
+        second = asyncio.run(fetch())
+
+    assert first == second == (200, b"<p>Chapter</p>")
+    assert validators == [None, '"v1"']
+
+
+def test_parse_pool_parses_in_worker_processes():
+    """Test that the parse pool starts and its workers parse a chapter page."""
+    page = b"""
+        <html><body><div class="edn_article">
+            <h2>Ch. 01 Legal System</h2>
+            <p>1.1.1 Singapore's legal system is based on the English common law.</p>
+        </div></body></html>
+    """
+
+    async def parse_in_pool():
+        pool = await _start_parse_pool()
+        try:
+            assert isinstance(pool, ProcessPoolExecutor)
+            return await asyncio.wrap_future(pool.submit(parse_chapter_content, page))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    parts = asyncio.run(parse_in_pool())
+
+    assert parts == [
+        ContentPart(
+            text="Ch. 01 Legal System", type="heading", original_text="Ch. 01 Legal System"
+        ),
+        ContentPart(
+            text="1.1.1 Singapore's legal system is based on the English common law.",
+            type="paragraph",
+            original_text="<p>1.1.1 Singapore's legal system is based on the English common law.</p>",
+        ),
+    ]
+
+
+def test_parse_pool_falls_back_to_in_process_parsing():
+    """Test that a pool whose workers can't run the parser is replaced by in-process parsing."""
+    broken_pool = MagicMock()
+    broken_pool.submit.side_effect = BrokenProcessPool("worker failed to import the parser")
+
+    with patch("resources.about_singapore_law._new_parse_pool", return_value=broken_pool):
+        pool = asyncio.run(_start_parse_pool())
+
+    assert pool is None
+    broken_pool.shutdown.assert_called_once()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -2,10 +2,13 @@
 Tests for the headlines resource.
 """
 
+import asyncio
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import respx
 
 from resources.headlines import (
     convert_date_to_iso,
@@ -17,6 +20,40 @@ from resources.headlines import (
 )
 
 
+@pytest.fixture(autouse=True)
+def cache_path(tmp_path):
+    """Keep each test's headlines cache in a temporary file of its own."""
+    path = str(tmp_path / "headlines_cache.db")
+    with patch("resources.headlines.CACHE_PATH", path):
+        yield path
+
+
+async def _passthrough_summary(entry_data, cache_db=None, llm_semaphore=None):
+    """Stand-in for the summary stage that leaves prepared entries unchanged."""
+    return entry_data
+
+
+class FakeOpenAI:
+    """Stand-in for openai.AsyncOpenAI that answers every chat completion with one summary.
+
+    Patch it in place of the class; each request's keyword arguments are kept in ``requests``.
+    """
+
+    def __init__(self, content):
+        self.content = content
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def __call__(self, **client_kwargs):
+        return self
+
+    async def _create(self, **kwargs):
+        self.requests.append(kwargs)
+        await asyncio.sleep(0)  # yield to the event loop, as a real request would
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+
 class TestUtilityFunctions:
     """Test utility functions in the headlines module."""
 
@@ -43,28 +80,22 @@ class TestUtilityFunctions:
         with pytest.raises(ValueError, match="At least one element is required"):
             get_hash_id([])
 
-    def test_convert_date_to_iso_standard_format(self):
-        """Test date conversion with standard format."""
-        date_str = "08 May 2025 00:01:00"
-        result = convert_date_to_iso(date_str)
-        assert result == "2025-05-08T00:01:00"
-
-    def test_convert_date_to_iso_abbreviated_format(self):
-        """Test date conversion with abbreviated month format."""
-        date_str = "08 May 2025 00:01:00"
-        result = convert_date_to_iso(date_str)
-        assert result == "2025-05-08T00:01:00"
+    @pytest.mark.parametrize(
+        "date_str, expected",
+        [
+            ("08 May 2025 00:01:00", "2025-05-08T00:01:00"),
+            ("08 September 2025 13:45:00", "2025-09-08T13:45:00"),  # full month name
+            ("08 Sep 2025 13:45:00", "2025-09-08T13:45:00"),  # abbreviated month name
+        ],
+    )
+    def test_convert_date_to_iso(self, date_str, expected):
+        """Test date conversion with full and abbreviated month names."""
+        assert convert_date_to_iso(date_str) == expected
 
     def test_convert_date_to_iso_invalid_format_returns_current(self):
         """Test that invalid date format returns current datetime."""
-        with patch("resources.headlines.datetime") as mock_datetime:
-            mock_now = MagicMock()
-            mock_now.isoformat.return_value = "2025-08-11T12:00:00"
-            mock_datetime.now.return_value = mock_now
-            mock_datetime.strptime.side_effect = ValueError("Invalid format")
-
-            result = convert_date_to_iso("invalid date")
-            assert result == "2025-08-11T12:00:00"
+        result = convert_date_to_iso("invalid date", now_fn=lambda: datetime(2025, 8, 11, 12))
+        assert result == "2025-08-11T12:00:00"
 
     def test_should_skip_advertisements(self):
         """Test that advertisements are properly filtered out."""
@@ -72,40 +103,102 @@ class TestUtilityFunctions:
         from datetime import datetime
 
         current_date = datetime.now()
-        
+
         # Test ADV: format
         adv_entry_1 = {
             "title": "ADV: Some advertisement content",
-            "published": "04 Sep 2025 00:01:00"
+            "published": "04 Sep 2025 00:01:00",
         }
-        
+
         # Test ADV JLP: format (space after ADV)
         adv_entry_2 = {
             "title": "ADV JLP: Starting an Action (Disputes)",
-            "published": "04 Sep 2025 00:01:00"
+            "published": "04 Sep 2025 00:01:00",
         }
-        
+
         # Test normal article (should not be skipped for advertisement)
         normal_entry = {
             "title": "Singapore, India to launch roadmap on cooperation",
-            "published": "04 Sep 2025 00:01:00"
+            "published": "04 Sep 2025 00:01:00",
         }
-        
+
         # Test advertisement filtering
-        should_skip_1, reason_1 = _should_skip_entry(adv_entry_1, current_date, None, set())
+        should_skip_1, reason_1, _ = _should_skip_entry(adv_entry_1, current_date, None, set())
         assert should_skip_1 is True
         assert reason_1 == "advertisement"
-        
-        should_skip_2, reason_2 = _should_skip_entry(adv_entry_2, current_date, None, set())
+
+        should_skip_2, reason_2, _ = _should_skip_entry(adv_entry_2, current_date, None, set())
         assert should_skip_2 is True
         assert reason_2 == "advertisement"
-        
+
         # Normal entry should not be skipped for advertisement
-        should_skip_normal, reason_normal = _should_skip_entry(normal_entry, current_date, None, set())
+        should_skip_normal, reason_normal, _ = _should_skip_entry(
+            normal_entry, current_date, None, set()
+        )
         # It might be skipped for other reasons, but not for advertisement
         if should_skip_normal:
             assert reason_normal != "advertisement"
 
+    def test_should_skip_known_link_without_parsing_date(self):
+        """Test that an entry whose link is already stored is skipped before date parsing."""
+        from resources.headlines import _should_skip_entry
+
+        entry = {
+            "title": "Singapore, India to launch roadmap on cooperation",
+            "link": "https://example.com/article",
+            "published": "04 Sep 2025 00:01:00",
+        }
+
+        with patch("resources.headlines.parse_headline_date") as mock_parse:
+            should_skip, reason, entry_date = _should_skip_entry(
+                entry, datetime.now(), None, set(), existing_links={"https://example.com/article"}
+            )
+
+        assert should_skip is True
+        assert reason == "already_processed_by_link"
+        assert entry_date is None
+        mock_parse.assert_not_called()
+
+    def test_should_skip_does_not_match_links_against_ids(self):
+        """Test that a link is only checked against stored links, not stored hash IDs."""
+        from resources.headlines import _should_skip_entry
+
+        entry = {
+            "title": "Singapore, India to launch roadmap on cooperation",
+            "link": "https://example.com/article",
+            "published": datetime.now().strftime("%d %B %Y %H:%M:%S"),
+        }
+
+        should_skip, reason, _ = _should_skip_entry(
+            entry, datetime.now(), None, {"https://example.com/article"}
+        )
+
+        assert should_skip is False
+        assert reason == ""
+
+    def test_jina_retry_wait_honours_retry_after(self):
+        """Test that a 429's Retry-After header sets the wait before the next attempt."""
+        import httpx
+
+        from resources.headlines import _is_retryable_jina_error, _jina_retry_wait
+
+        request = httpx.Request("GET", "https://r.jina.ai/https://example.com")
+        response = httpx.Response(429, headers={"Retry-After": "7"}, request=request)
+        error = httpx.HTTPStatusError("Too Many Requests", request=request, response=response)
+        retry_state = MagicMock()
+        retry_state.outcome.exception.return_value = error
+
+        assert _jina_retry_wait(retry_state) == 7.0
+        assert _is_retryable_jina_error(error) is True
+
+        unprocessable = httpx.Response(422, request=request)
+        assert (
+            _is_retryable_jina_error(
+                httpx.HTTPStatusError("Unprocessable", request=request, response=unprocessable)
+            )
+            is False
+        )
+
 
 class TestAsyncFunctions:
     """Test async functions in the headlines module."""
@@ -118,41 +211,89 @@ class TestAsyncFunctions:
             assert result == ""
 
     @pytest.mark.asyncio
+    @respx.mock
     async def test_get_jina_reader_content_success(self):
         """Test successful Jina reader content fetch."""
+        route = respx.get("https://r.jina.ai/https://example.com").respond(
+            200, text="Article content here"
+        )
+
+        with patch.dict("os.environ", {"JINA_API_TOKEN": "test-token"}):
+            result = await get_jina_reader_content("https://example.com")
+
+        assert result == "Article content here"
+        assert route.calls.last.request.headers["Authorization"] == "Bearer test-token"
+
+    @pytest.mark.asyncio
+    async def test_get_jina_reader_content_uses_shared_client(self):
+        """Test that a passed-in client is reused instead of opening a new one."""
         mock_response = MagicMock()
         mock_response.text = "Article content here"
+        shared_client = MagicMock()
+        shared_client.get = AsyncMock(return_value=mock_response)
 
         with patch.dict("os.environ", {"JINA_API_TOKEN": "test-token"}):
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                    return_value=mock_response
-                )
+                result = await get_jina_reader_content("https://example.com", shared_client)
 
-                result = await get_jina_reader_content("https://example.com")
                 assert result == "Article content here"
+                shared_client.get.assert_awaited_once()
+                mock_client.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_get_summary_missing_api_key(self):
-        """Test summary generation with missing OpenAI API key."""
-        with patch.dict("os.environ", {}, clear=True):
+    async def test_get_jina_reader_content_cache(self):
+        """Test that fetched content is cached and served without another request."""
+        from sqlite_utils import Database
+
+        db = Database(memory=True)
+        mock_response = MagicMock()
+        mock_response.text = "Article content here"
+        shared_client = MagicMock()
+        shared_client.get = AsyncMock(return_value=mock_response)
+
+        with patch.dict("os.environ", {"JINA_API_TOKEN": "test-token"}):
+            first = await get_jina_reader_content("https://example.com", shared_client, db)
+            second = await get_jina_reader_content("https://example.com", shared_client, db)
+
+        assert first == second == "Article content here"
+        shared_client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_summary_missing_base_url(self):
+        """Test that summary generation is skipped when no LLM server is configured."""
+        with patch.dict("os.environ", {"LLM_BASE_URL": ""}, clear=True):
             result = await get_summary("Some article text")
             assert result == ""
 
     @pytest.mark.asyncio
     async def test_get_summary_success(self):
         """Test successful summary generation."""
-        mock_response = MagicMock()
-        mock_response.output_text = "This is a summary"
-
-        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
-            with patch("openai.AsyncOpenAI") as mock_openai:
-                mock_client = MagicMock()
-                mock_client.responses.create = AsyncMock(return_value=mock_response)
-                mock_openai.return_value = mock_client
+        fake_openai = FakeOpenAI("This is a summary")
 
+        with patch.dict("os.environ", {"LLM_API_KEY": "test-key", "LLM_MODEL": "test-model"}):
+            with patch("openai.AsyncOpenAI", fake_openai):
                 result = await get_summary("Article text to summarize")
-                assert result == "This is a summary"
+
+        assert result == "This is a summary"
+        (request,) = fake_openai.requests
+        assert request["model"] == "test-model"
+        assert "Article text to summarize" in request["messages"][-1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_get_summary_cache(self):
+        """Test that a summary is cached and the LLM is not called again for the same text."""
+        from sqlite_utils import Database
+
+        db = Database(memory=True)
+        fake_openai = FakeOpenAI("This is a summary")
+
+        with patch.dict("os.environ", {"LLM_API_KEY": "test-key"}):
+            with patch("openai.AsyncOpenAI", fake_openai):
+                first = await get_summary("Article text to summarize", db)
+                second = await get_summary("Article text to summarize", db)
+
+        assert first == second == "This is a summary"
+        assert len(fake_openai.requests) == 1
 
     @pytest.mark.asyncio
     async def test_process_entry_success(self):
@@ -219,8 +360,13 @@ class TestAsyncFunctions:
             },
         ]
 
-        with patch("feedparser.parse", return_value=mock_feed):
-            with patch("resources.headlines.process_entry", new_callable=AsyncMock) as mock_process:
+        with (
+            patch("feedparser.parse", return_value=mock_feed),
+            patch("resources.headlines._summarise_entry", side_effect=_passthrough_summary),
+        ):
+            with patch(
+                "resources.headlines._prepare_entry", new_callable=AsyncMock
+            ) as mock_process:
                 mock_process.return_value = {
                     "id": "test123",
                     "title": "Test Article 1",
@@ -230,24 +376,97 @@ class TestAsyncFunctions:
 
                 result = await fetch_data(None)
 
-                # Should skip ADV entries, so only 1 call to process_entry
+                # Should skip ADV entries, so only 1 entry is processed
                 assert mock_process.call_count == 1
                 assert len(result) == 1
 
+    @pytest.mark.asyncio
+    async def test_fetch_data_advertisements_only_skips_table_scan(self):
+        """Test that a feed of only advertisements never reads the existing table."""
+        mock_feed = MagicMock()
+        mock_feed.entries = [
+            {
+                "published": "01 January 2025 00:00:00",
+                "title": "ADV: Course",
+                "link": "https://ad1.com",
+            },
+            {
+                "published": "02 January 2025 00:00:00",
+                "title": "ADV\uff1aEvent",
+                "link": "https://ad2.com",
+            },
+        ]
+
+        with (
+            patch("feedparser.parse", return_value=mock_feed),
+            patch("resources.headlines._backfill_empty_summaries", new_callable=AsyncMock),
+            patch("resources.headlines._get_existing_data") as mock_existing,
+        ):
+            result = await fetch_data(MagicMock())
+
+        assert result == []
+        mock_existing.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_data_conditional_get(self):
+        """Test that feed validators are stored and an unchanged feed is skipped."""
+        import feedparser
+        import sqlite_utils
+
+        db = sqlite_utils.Database(memory=True)
+        db["headlines"].insert(
+            {"id": "old", "source_link": "https://old.com", "summary": "S", "date": "2025-01-01"},
+            pk="id",
+        )
+        # Left behind by versions that kept their caches in the published database
+        db["_feed_state"].insert({"url": "https://old.com", "etag": '"v0"'}, pk="url")
+        changed = feedparser.FeedParserDict(status=200, etag='"v1"', entries=[])
+        unchanged = feedparser.FeedParserDict(status=304, entries=[])
+
+        with patch("feedparser.parse", side_effect=[changed, unchanged]) as mock_parse:
+            assert await fetch_data(db["headlines"]) == []
+            assert await fetch_data(db["headlines"]) == []
+
+        assert mock_parse.call_args_list[0].kwargs["etag"] is None
+        assert mock_parse.call_args_list[1].kwargs["etag"] == '"v1"'
+        assert db.table_names() == ["headlines"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_data_drops_failed_entries(self):
+        """Test that entries whose processing failed are not returned for insertion."""
+        yesterday = (datetime.now() - timedelta(days=1)).strftime("%d %B %Y %H:%M:%S")
+        mock_feed = MagicMock()
+        mock_feed.entries = [
+            {"published": yesterday, "title": "Good Article", "link": "https://example1.com"},
+            {"published": yesterday, "title": "Broken Article", "link": "https://example2.com"},
+        ]
+
+        async def fake_process(entry, *args, **kwargs):
+            if entry["title"] == "Broken Article":
+                return None
+            return {"id": "good", "title": entry["title"]}
+
+        with (
+            patch("feedparser.parse", return_value=mock_feed),
+            patch("resources.headlines._summarise_entry", side_effect=_passthrough_summary),
+        ):
+            with patch("resources.headlines._prepare_entry", side_effect=fake_process):
+                result = await fetch_data(None)
+
+        assert result == [{"id": "good", "title": "Good Article"}]
+
     @pytest.mark.asyncio
     async def test_fetch_data_with_existing_table(self):
         """Test fetch_data with existing table and metadata."""
-        mock_table = MagicMock()
-        mock_table.name = "headlines"
-
-        mock_db = MagicMock()
-        mock_db.table_names.return_value = ["_zeeker_updates", "headlines"]
-        mock_table.db = mock_db
+        import sqlite_utils
 
+        # The newest stored article sets the cutoff for what counts as new
+        db = sqlite_utils.Database(memory=True)
         two_days_ago = (datetime.now() - timedelta(days=2)).isoformat()
-        mock_updates_table = MagicMock()
-        mock_updates_table.get.return_value = {"last_updated": two_days_ago}
-        mock_db.__getitem__.return_value = mock_updates_table
+        db["headlines"].insert(
+            {"id": "stored", "source_link": "https://a.com", "summary": "S", "date": two_days_ago},
+            pk="id",
+        )
 
         yesterday = (datetime.now() - timedelta(days=1)).strftime("%d %B %Y %H:%M:%S")
         three_days_ago = (datetime.now() - timedelta(days=3)).strftime("%d %B %Y %H:%M:%S")
@@ -267,15 +486,58 @@ class TestAsyncFunctions:
             },
         ]
 
-        with patch("feedparser.parse", return_value=mock_feed):
-            with patch("resources.headlines.process_entry", new_callable=AsyncMock) as mock_process:
+        with (
+            patch("feedparser.parse", return_value=mock_feed),
+            patch("resources.headlines._summarise_entry", side_effect=_passthrough_summary),
+        ):
+            with patch(
+                "resources.headlines._prepare_entry", new_callable=AsyncMock
+            ) as mock_process:
                 mock_process.return_value = {"id": "test123", "title": "New Article"}
 
-                await fetch_data(mock_table)
+                await fetch_data(db["headlines"])
 
                 # Should only process the new article
                 assert mock_process.call_count == 1
 
+    def test_fetch_data_runs_in_fresh_event_loops(self, cache_path):
+        """Test that consecutive runs in separate event loops, as zeeker makes them, both succeed."""
+        import sqlite_utils
+
+        db = sqlite_utils.Database(memory=True)
+        # More empty summaries than LLM permits, so backfill calls wait on the semaphore
+        db["headlines"].insert_all(
+            [
+                {
+                    "id": str(i),
+                    "title": f"Article {i}",
+                    "source_link": f"https://{i}.com",
+                    "summary": "",
+                }
+                for i in range(6)
+            ],
+            pk="id",
+        )
+        mock_feed = MagicMock()
+        mock_feed.entries = []
+        fake_openai = FakeOpenAI("Backfilled summary")
+
+        with (
+            patch.dict("os.environ", {"LLM_API_KEY": "test-key"}),
+            patch("openai.AsyncOpenAI", fake_openai),
+            patch("feedparser.parse", return_value=mock_feed),
+            patch("resources.headlines._fetch_article_text", new_callable=AsyncMock) as mock_fetch,
+        ):
+            mock_fetch.return_value = "Article text"
+            for _ in range(2):
+                db.execute("UPDATE headlines SET summary = ''")
+                sqlite_utils.Database(cache_path)["_summary_cache"].drop(ignore=True)
+                assert asyncio.run(fetch_data(db["headlines"])) == []
+                summaries = {row["summary"] for row in db["headlines"].rows}
+                assert summaries == {"Backfilled summary"}
+
+        assert len(fake_openai.requests) == 12
+
     @pytest.mark.asyncio
     async def test_process_entry_problematic_url_handling(self):
         """Test that problematic URLs are handled gracefully."""
@@ -291,20 +553,20 @@ class TestAsyncFunctions:
             "published": "04 Sep 2025 00:01:00",
         }
 
-        with patch("resources.headlines.get_jina_reader_content") as mock_jina, patch(
-            "resources.headlines.get_summary"
-        ) as mock_summary:
-            # Mock OpenAI response
-            mock_summary.return_value = "Fallback summary for legal article"
-
+        with (
+            patch("resources.headlines.get_jina_reader_content") as mock_jina,
+            patch("resources.headlines.get_summary") as mock_summary,
+        ):
             result = await process_entry(test_entry)
 
             # Should not call Jina Reader for problematic URLs
             assert mock_jina.call_count == 0
-            
+            # Nor spend an LLM call summarising the placeholder text
+            assert mock_summary.call_count == 0
+
             # Should still return a valid result with fallback content
             assert result is not None
             assert result["title"] == "Test LawNet Article"
             assert "Content could not be retrieved" in result["text"]
-            assert result["summary"] == "Fallback summary for legal article"
-
+            assert result["summary"] == "Legal news article: Test LawNet Article"
+            assert result["_llm_failed"] is False